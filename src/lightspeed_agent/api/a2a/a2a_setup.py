@@ -164,6 +164,7 @@ def setup_a2a_routes(app: FastAPI) -> None:
     )
 
     logger.info(
-        f"A2A routes configured: AgentCard at /.well-known/agent.json, "
-        f"JSON-RPC at /, agent_url={settings.agent_provider_url}"
+        "A2A routes configured: AgentCard at /.well-known/agent.json, "
+        "JSON-RPC at /, agent_url=%s",
+        settings.agent_provider_url,
     )
@@ -57,7 +57,7 @@ class UsageTrackingPlugin(BasePlugin):
     async def before_run_callback(self, *, invocation_context) -> None:
         """Track request count at start of each run."""
         _aggregate_usage.total_requests += 1
-        logger.debug(f"Request #{_aggregate_usage.total_requests} started")
+        logger.debug("Request #%d started", _aggregate_usage.total_requests)
         return None
 
     async def after_model_callback(
@@ -76,9 +76,11 @@ class UsageTrackingPlugin(BasePlugin):
             _aggregate_usage.total_output_tokens += output_tokens
 
             logger.debug(
-                f"Tokens: in={input_tokens}, out={output_tokens}, "
-                f"totals: in={_aggregate_usage.total_input_tokens}, "
-                f"out={_aggregate_usage.total_output_tokens}"
+                "Tokens: in=%d, out=%d, totals: in=%d, out=%d",
+                input_tokens,
+                output_tokens,
+                _aggregate_usage.total_input_tokens,
+                _aggregate_usage.total_output_tokens,
             )
 
         return None  # Don't modify the response
@@ -93,8 +95,10 @@ class UsageTrackingPlugin(BasePlugin):
     ) -> Optional[dict]:
         """Track tool/MCP calls."""
         _aggregate_usage.total_tool_calls += 1
-        tool_name = getattr(tool, "name", type(tool).__name__)
-        logger.debug(
-            f"Tool call: {tool_name}, total calls: {_aggregate_usage.total_tool_calls}"
-        )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Tool call: %s, total calls: %d",
+                getattr(tool, "name", type(tool).__name__),
+                _aggregate_usage.total_tool_calls,
+            )
         return None  # Don't modify the result
@@ -11,7 +11,9 @@ marketplace-handler service. See lightspeed_agent.marketplace.
 import logging
 from contextlib import asynccontextmanager
 
-from fastapi import FastAPI
+import orjson
+from a2a.extensions.common import HTTP_EXTENSION_HEADER
+from fastapi import FastAPI, Response
 from fastapi.middleware.cors import CORSMiddleware
 
 from lightspeed_agent.api.a2a.a2a_setup import setup_a2a_routes
@@ -67,6 +69,14 @@ async def lifespan(app: FastAPI):
         except Exception as e:
             logger.error("Failed to stop reporting scheduler: %s", e)
 
+    # Shutdown: Close pooled introspection HTTP connections
+    try:
+        from lightspeed_agent.auth.introspection import close_token_introspector
+
+        await close_token_introspector()
+    except Exception as e:
+        logger.error("Failed to close token introspector: %s", e)
+
     # Shutdown: Close database connection
     try:
         from lightspeed_agent.db import close_database
@@ -77,6 +87,11 @@ async def lifespan(app: FastAPI):
         logger.error("Failed to close database: %s", e)
 
 
+def _json_bytes(content: dict) -> bytes:
+    """Serialize a response body to compact JSON bytes."""
+    return orjson.dumps(content)
+
+
 def create_app() -> FastAPI:
     """Create and configure the FastAPI application.
 
@@ -94,17 +109,23 @@ def create_app() -> FastAPI:
         lifespan=lifespan,
     )
 
+    # Static response bodies are serialized once here instead of per request;
+    # health and ready checks are hit continuously by liveness probes.
+    health_body = _json_bytes({"status": "healthy", "agent": settings.agent_name})
+    ready_body = _json_bytes({"status": "ready", "agent": settings.agent_name})
+    agent_card_body = _json_bytes(get_agent_card_dict())
+
     # Health check endpoint
     @app.get("/health")
-    async def health_check() -> dict:
+    async def health_check() -> Response:
         """Health check endpoint."""
-        return {"status": "healthy", "agent": settings.agent_name}
+        return Response(content=health_body, media_type="application/json")
 
     # Ready check endpoint
     @app.get("/ready")
-    async def ready_check() -> dict:
+    async def ready_check() -> Response:
         """Readiness check endpoint."""
-        return {"status": "ready", "agent": settings.agent_name}
+        return Response(content=ready_body, media_type="application/json")
 
     # Set up A2A protocol routes using ADK's built-in integration
     # This provides:
@@ -116,20 +137,20 @@ def create_app() -> FastAPI:
 
     # Alias for agent card (some clients use agent-card.json instead of agent.json)
     @app.get("/.well-known/agent-card.json")
-    async def agent_card_alias() -> dict:
+    async def agent_card_alias() -> Response:
         """AgentCard endpoint (alias for agent.json)."""
-        return get_agent_card_dict()
+        return Response(content=agent_card_body, media_type="application/json")
 
     # Usage statistics endpoint
     # Returns aggregate token and request counts tracked by UsageTrackingPlugin
     @app.get("/usage")
-    async def get_usage_stats() -> dict:
+    async def get_usage_stats() -> Response:
         """Get aggregate usage statistics."""
         usage = get_aggregate_usage()
-        return {
-            "status": "ok",
-            "usage": usage.to_dict(),
-        }
+        return Response(
+            content=_json_bytes({"status": "ok", "usage": usage.to_dict()}),
+            media_type="application/json",
+        )
 
     # Add rate limiting middleware
     app.add_middleware(RateLimitMiddleware)
@@ -140,15 +161,24 @@ def create_app() -> FastAPI:
     app.add_middleware(AuthenticationMiddleware)
 
     # Add CORS middleware for A2A Inspector and other browser-based clients
-    # This must be added after other middleware to be processed first
+    # This must be added after other middleware to be processed first, so
+    # preflight requests are answered before reaching auth or rate limiting.
     # Middleware execution order: CORS -> Auth -> RateLimit -> Handler
+    # Browsers reject credentials with a wildcard origin, so credentials are
+    # only allowed when explicit origins are configured.
     app.add_middleware(
         CORSMiddleware,
-        allow_origins=["*"],  # Allow all origins for development
-        allow_credentials=True,
-        allow_methods=["*"],
-        allow_headers=["*"],
-        expose_headers=["*"],
+        allow_origins=settings.cors_allowed_origins,
+        allow_credentials="*" not in settings.cors_allowed_origins,
+        allow_methods=["GET", "POST", "OPTIONS"],
+        # A2A clients negotiate extensions (e.g. DCR) via X-A2A-Extensions
+        allow_headers=["authorization", "content-type", HTTP_EXTENSION_HEADER.lower()],
+        expose_headers=[
+            "retry-after",
+            "x-ratelimit-limit",
+            "x-ratelimit-remaining",
+            HTTP_EXTENSION_HEADER.lower(),
+        ],
     )
 
     # Include Service Control router (admin endpoints for usage reporting)
@@ -2,10 +2,10 @@
 
 import logging
 from collections.abc import Callable, Coroutine
+from functools import lru_cache
 from typing import Annotated, Any
 
 from fastapi import Depends, HTTPException, Request, status
-from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 
 from lightspeed_agent.auth.introspection import (
     InsufficientScopeError,
@@ -17,13 +17,26 @@ from lightspeed_agent.auth.models import AuthenticatedUser
 
 logger = logging.getLogger(__name__)
 
-# HTTP Bearer authentication scheme
-bearer_scheme = HTTPBearer(auto_error=False)
+
+def _get_bearer_token(request: Request) -> str | None:
+    """Return the Bearer token for the request, if any.
+
+    Prefers the token already extracted by AuthenticationMiddleware and
+    only falls back to parsing the Authorization header when the
+    middleware did not run for this path.
+    """
+    token: str | None = getattr(request.state, "access_token", None)
+    if token:
+        return token
+
+    scheme, _, credentials = request.headers.get("authorization", "").partition(" ")
+    if scheme.lower() != "bearer" or not credentials:
+        return None
+    return credentials
 
 
 async def get_current_user(
     request: Request,
-    credentials: Annotated[HTTPAuthorizationCredentials | None, Depends(bearer_scheme)],
     introspector: Annotated[TokenIntrospector, Depends(get_token_introspector)],
 ) -> AuthenticatedUser:
     """Extract and validate the current user from the request.
@@ -33,7 +46,6 @@ async def get_current_user(
 
     Args:
         request: FastAPI request object
-        credentials: HTTP Authorization credentials
         introspector: Token introspector instance
 
     Returns:
@@ -42,7 +54,8 @@ async def get_current_user(
     Raises:
         HTTPException: If authentication or authorization fails
     """
-    if not credentials:
+    token = _get_bearer_token(request)
+    if not token:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Missing authentication credentials",
@@ -50,9 +63,7 @@ async def get_current_user(
         )
 
     try:
-        user = await introspector.validate_token(credentials.credentials)
-        # Store the raw access token for forwarding to downstream services
-        user.access_token = credentials.credentials
+        user = await introspector.validate_token(token)
         # Store user in request state for access in other parts of the app
         request.state.user = user
         return user
@@ -71,11 +82,15 @@ async def get_current_user(
         ) from None
 
 
+@lru_cache(maxsize=64)
 def require_scope(
     required_scope: str,
 ) -> Callable[..., Coroutine[Any, Any, AuthenticatedUser]]:
     """Create a dependency that requires a specific scope.
 
+    The checker is cached per scope so routes sharing a scope reuse the
+    same dependency callable, letting FastAPI deduplicate it per request.
+
     Args:
         required_scope: The scope that must be present in the token
 
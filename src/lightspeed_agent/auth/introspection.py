@@ -11,7 +11,10 @@ Reference: https://github.com/ljogeiger/GE-A2A-Marketplace-Agent/tree/main/2_oau
 
 from __future__ import annotations
 
+import hashlib
 import logging
+import time
+from collections import OrderedDict
 from datetime import UTC, datetime
 
 import httpx
@@ -21,6 +24,12 @@ from lightspeed_agent.config import Settings, get_settings
 
 logger = logging.getLogger(__name__)
 
+# Expiry assumed for tokens whose introspection response carries no ``exp``
+_NO_EXPIRY = datetime(2099, 12, 31, 23, 59, 59, tzinfo=UTC)
+
+# Upper bound on cached introspection results (least recently used evicted)
+_CACHE_MAX_ENTRIES = 10_000
+
 
 class TokenValidationError(Exception):
     """Raised when a token is invalid or inactive (HTTP 401)."""
@@ -37,14 +46,31 @@ class TokenIntrospector:
     ``RED_HAT_SSO_CLIENT_ID`` / ``RED_HAT_SSO_CLIENT_SECRET`` (HTTP Basic
     Auth).  Keycloak returns ``{"active": true/false, …}``; we then check
     that the required scope is present.
+
+    A single ``httpx.AsyncClient`` is reused across calls so connections to
+    the introspection endpoint are kept alive between requests.
+
+    Successful results are cached for ``TOKEN_INTROSPECTION_CACHE_TTL``
+    seconds (never past the token's own ``exp``), keyed by the SHA-256
+    digest of the token so the raw token is never held in memory.
+    Inactive tokens and scope failures are not cached.
     """
 
-    def __init__(self, settings: Settings | None = None) -> None:
+    def __init__(
+        self,
+        settings: Settings | None = None,
+        http_client: httpx.AsyncClient | None = None,
+    ) -> None:
         self._settings = settings or get_settings()
+        self._http_client = http_client
         self._introspection_url = self._settings.keycloak_introspection_endpoint
         self._client_id = self._settings.red_hat_sso_client_id
         self._client_secret = self._settings.red_hat_sso_client_secret
         self._required_scope = self._settings.agent_required_scope
+        self._skip_validation = self._settings.skip_jwt_validation
+        self._dev_user: AuthenticatedUser | None = None
+        self._cache_ttl = self._settings.token_introspection_cache_ttl
+        self._cache: OrderedDict[bytes, tuple[float, AuthenticatedUser]] = OrderedDict()
 
     async def validate_token(self, token: str) -> AuthenticatedUser:
         """Validate a Bearer token via introspection.
@@ -59,10 +85,16 @@ class TokenIntrospector:
             TokenValidationError: Token is inactive or introspection failed.
             InsufficientScopeError: Token is active but missing the required scope.
         """
-        if self._settings.skip_jwt_validation:
+        if self._skip_validation:
             logger.warning("Token validation skipped — development mode")
             return self._create_dev_user()
 
+        cache_key = hashlib.sha256(token.encode()).digest() if self._cache_ttl else None
+        if cache_key is not None:
+            cached = self._get_cached(cache_key)
+            if cached is not None:
+                return cached
+
         data = await self._introspect(token)
 
         if not data.get("active"):
@@ -75,22 +107,59 @@ class TokenIntrospector:
                 f"Token is missing required scope: {self._required_scope}"
             )
 
-        return self._to_user(data, scopes)
+        user = self._to_user(data, scopes)
+        if cache_key is not None:
+            self._store_cached(cache_key, user, data.get("exp"))
+        return user
+
+    async def close(self) -> None:
+        """Close the pooled HTTP client, if one was created."""
+        if self._http_client is not None:
+            await self._http_client.aclose()
+            self._http_client = None
 
     # ------------------------------------------------------------------
     # Internals
     # ------------------------------------------------------------------
 
+    def _get_http_client(self) -> httpx.AsyncClient:
+        """Get the pooled HTTP client (lazy initialization)."""
+        if self._http_client is None:
+            self._http_client = httpx.AsyncClient(timeout=30.0)
+        return self._http_client
+
+    def _get_cached(self, key: bytes) -> AuthenticatedUser | None:
+        """Return the cached, unexpired user for a token digest."""
+        entry = self._cache.get(key)
+        if entry is None:
+            return None
+        expires_at, user = entry
+        if expires_at <= time.monotonic():
+            del self._cache[key]
+            return None
+        self._cache.move_to_end(key)
+        return user
+
+    def _store_cached(self, key: bytes, user: AuthenticatedUser, exp: int | None) -> None:
+        """Cache a validated user, bounded by the configured TTL and token expiry."""
+        ttl = float(self._cache_ttl)
+        if exp:
+            ttl = min(ttl, exp - time.time())
+        if ttl <= 0:
+            return
+        self._cache[key] = (time.monotonic() + ttl, user)
+        self._cache.move_to_end(key)
+        if len(self._cache) > _CACHE_MAX_ENTRIES:
+            self._cache.popitem(last=False)
+
     async def _introspect(self, token: str) -> dict:
         """POST to the introspection endpoint."""
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    self._introspection_url,
-                    data={"token": token, "token_type_hint": "access_token"},
-                    auth=(self._client_id, self._client_secret),
-                    timeout=30.0,
-                )
+            response = await self._get_http_client().post(
+                self._introspection_url,
+                data={"token": token, "token_type_hint": "access_token"},
+                auth=(self._client_id, self._client_secret),
+            )
 
             if response.status_code != 200:
                 logger.error(
@@ -111,22 +180,18 @@ class TokenIntrospector:
             ) from exc
 
     @staticmethod
-    def _parse_scopes(data: dict) -> list[str]:
+    def _parse_scopes(data: dict) -> frozenset[str]:
         scope_str = data.get("scope", "")
-        return scope_str.split() if scope_str else []
+        return frozenset(scope_str.split()) if scope_str else frozenset()
 
-    def _to_user(self, data: dict, scopes: list[str]) -> AuthenticatedUser:
+    def _to_user(self, data: dict, scopes: frozenset[str]) -> AuthenticatedUser:
         """Map an introspection response to an AuthenticatedUser."""
         # client_id: azp (authorized party) or client_id field
         client_id = data.get("azp") or data.get("client_id", "")
 
         # Token expiry
         exp = data.get("exp")
-        token_exp = (
-            datetime.fromtimestamp(exp, tz=UTC)
-            if exp
-            else datetime.now(UTC).replace(year=2099)
-        )
+        token_exp = datetime.fromtimestamp(exp, tz=UTC) if exp else _NO_EXPIRY
 
         metadata: dict[str, str] = {}
         if data.get("order_id"):
@@ -147,18 +212,23 @@ class TokenIntrospector:
         )
 
     def _create_dev_user(self) -> AuthenticatedUser:
-        """Return a default user when validation is skipped."""
-        return AuthenticatedUser(
-            user_id="dev-user",
-            client_id="dev-client",
-            username="developer",
-            email="dev@example.com",
-            name="Development User",
-            org_id="dev-org",
-            scopes=["openid", "profile", "email", "agent:insights"],
-            token_exp=datetime.now(UTC).replace(year=2099),
-            metadata={"order_id": "dev-order"},
-        )
+        """Return a default user when validation is skipped.
+
+        The user is immutable, so one instance is built and shared.
+        """
+        if self._dev_user is None:
+            self._dev_user = AuthenticatedUser(
+                user_id="dev-user",
+                client_id="dev-client",
+                username="developer",
+                email="dev@example.com",
+                name="Development User",
+                org_id="dev-org",
+                scopes=frozenset({"openid", "profile", "email", "agent:insights"}),
+                token_exp=_NO_EXPIRY,
+                metadata={"order_id": "dev-order"},
+            )
+        return self._dev_user
 
 
 # ------------------------------------------------------------------
@@ -174,3 +244,9 @@ def get_token_introspector() -> TokenIntrospector:
     if _introspector is None:
         _introspector = TokenIntrospector()
     return _introspector
+
+
+async def close_token_introspector() -> None:
+    """Close the global TokenIntrospector's HTTP client on shutdown."""
+    if _introspector is not None:
+        await _introspector.close()
@@ -8,6 +8,7 @@ from typing import Any
 from fastapi import Request, Response
 from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.responses import JSONResponse
+from starlette.types import Receive, Scope, Send
 
 from lightspeed_agent.auth.introspection import (
     InsufficientScopeError,
@@ -40,30 +41,27 @@ class AuthenticationMiddleware(BaseHTTPMiddleware):
     """
 
     # Paths that require authentication (POST only)
-    PROTECTED_PATHS = {"/"}
-
-    # Paths that are always public (no auth required)
-    PUBLIC_PATHS = {
-        "/health",
-        "/healthz",
-        "/ready",
-        "/docs",
-        "/openapi.json",
-        "/redoc",
-        "/.well-known/agent.json",
-        "/.well-known/agent-card.json",
-        "/oauth/register",  # DCR endpoint uses software_statement JWT
-        "/marketplace/pubsub",  # Pub/Sub uses Google-signed tokens
-    }
-
-    # Path prefixes that are public
-    PUBLIC_PREFIXES = (
-        "/marketplace/",
-    )
+    PROTECTED_PATHS = frozenset({"/"})
+
+    # Methods that require authentication, keyed by protected path. This is
+    # the only auth rule: every other path/method combination is public.
+    PROTECTED_METHODS = {path: frozenset({"POST"}) for path in PROTECTED_PATHS}
+
+    # Liveness/readiness probes, passed straight through at the ASGI level
+    PROBE_PATHS = frozenset({"/health", "/healthz", "/ready"})
 
     def __init__(self, app: Any):
         super().__init__(app)
         self._settings = get_settings()
+        # Read per request; bound once as a plain attribute
+        self._skip_jwt_validation = self._settings.skip_jwt_validation
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Short-circuit probe requests before BaseHTTPMiddleware wraps them."""
+        if scope["type"] == "http" and scope["path"] in self.PROBE_PATHS:
+            await self.app(scope, receive, send)
+            return
+        await super().__call__(scope, receive, send)
 
     async def dispatch(
         self,
@@ -71,8 +69,9 @@ class AuthenticationMiddleware(BaseHTTPMiddleware):
         call_next,
     ) -> Response:
         """Process request with authentication check."""
-        path = request.url.path
-        method = request.method
+        # Read straight from the ASGI scope to avoid building a URL object
+        path = request.scope["path"]
+        method = request.scope["method"]
 
         # Skip authentication for public paths
         if self._is_public(path, method):
@@ -80,7 +79,7 @@ class AuthenticationMiddleware(BaseHTTPMiddleware):
 
         # Skip authentication in development mode, but still extract the
         # Bearer token so it can be forwarded to downstream services (MCP).
-        if self._settings.skip_jwt_validation:
+        if self._skip_jwt_validation:
             logger.debug("Skipping authentication (development mode)")
             self._extract_token_for_passthrough(request)
             return await call_next(request)
@@ -115,25 +114,12 @@ class AuthenticationMiddleware(BaseHTTPMiddleware):
         return await call_next(request)
 
     def _is_public(self, path: str, method: str) -> bool:
-        """Check if path/method combination is public."""
-        # Explicit public paths
-        if path in self.PUBLIC_PATHS:
-            return True
-
-        # Public prefixes
-        if path.startswith(self.PUBLIC_PREFIXES):
-            return True
+        """Check if path/method combination is public.
 
-        # GET requests to root are public (for compatibility)
-        if path == "/" and method == "GET":
-            return True
-
-        # Only POST to protected paths requires auth
-        if path in self.PROTECTED_PATHS and method == "POST":
-            return False
-
-        # Everything else is public by default
-        return True
+        Only the methods listed in ``PROTECTED_METHODS`` for a protected
+        path require auth (e.g. POST /); everything else is public.
+        """
+        return method not in self.PROTECTED_METHODS.get(path, ())
 
     @staticmethod
     def _extract_token_for_passthrough(request: Request) -> None:
@@ -2,12 +2,14 @@
 
 from datetime import datetime
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class JWTClaims(BaseModel):
     """JWT token claims."""
 
+    model_config = ConfigDict(frozen=True)
+
     iss: str = Field(..., description="Issuer")
     sub: str = Field(..., description="Subject (user ID)")
     aud: str | list[str] = Field(..., description="Audience")
@@ -23,7 +25,15 @@ class JWTClaims(BaseModel):
 
 
 class AuthenticatedUser(BaseModel):
-    """Authenticated user information extracted from JWT."""
+    """Authenticated user information extracted from JWT.
+
+    Frozen so validated users can be cached and shared between requests.
+    The raw access token is deliberately not stored here; it stays on
+    ``request.state.access_token`` and in the request context used by the
+    MCP header provider.
+    """
+
+    model_config = ConfigDict(frozen=True)
 
     user_id: str = Field(..., description="User ID (sub claim)")
     client_id: str = Field(..., description="Client ID (azp or aud claim)")
@@ -31,17 +41,11 @@ class AuthenticatedUser(BaseModel):
     email: str | None = Field(default=None, description="Email")
     name: str | None = Field(default=None, description="Full name")
     org_id: str | None = Field(default=None, description="Organization ID")
-    scopes: list[str] = Field(default_factory=list, description="Granted scopes")
+    scopes: frozenset[str] = Field(default_factory=frozenset, description="Granted scopes")
     token_exp: datetime = Field(..., description="Token expiration time")
     # Metadata for additional claims (order_id, etc.)
     metadata: dict[str, str] = Field(
         default_factory=dict,
         description="Additional metadata from token claims",
     )
-    # Raw access token for forwarding to downstream services (e.g., MCP)
-    access_token: str | None = Field(
-        default=None,
-        description="Raw access token for forwarding to downstream services",
-        exclude=True,  # Exclude from serialization for security
-    )
 
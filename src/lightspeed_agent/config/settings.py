@@ -15,6 +15,7 @@ class Settings(BaseSettings):
         env_file_encoding="utf-8",
         case_sensitive=False,
         extra="ignore",
+        frozen=True,
     )
 
     # Google AI / Gemini Configuration
@@ -95,6 +96,13 @@ class Settings(BaseSettings):
         default=8000,
         description="Server port",
     )
+    cors_allowed_origins: list[str] = Field(
+        default=["*"],
+        description=(
+            "Origins allowed by CORS (JSON list). "
+            "Credentials are only allowed for explicit origins."
+        ),
+    )
 
     # Marketplace Handler Configuration
     # The marketplace handler is a separate service that handles DCR and Pub/Sub events
@@ -166,6 +174,14 @@ class Settings(BaseSettings):
         default=10,
         description="Maximum overflow connections beyond pool size",
     )
+    database_statement_cache_size: int = Field(
+        default=512,
+        ge=0,
+        description=(
+            "Prepared statement cache size per asyncpg connection "
+            "(0 behind PgBouncer transaction pooling)"
+        ),
+    )
 
     # Session database: stores ADK sessions, conversation history, memory
     # Separate from marketplace DB for security isolation - each agent can have its own
@@ -179,6 +195,11 @@ class Settings(BaseSettings):
         default="agent:insights",
         description="OAuth scope required in access tokens. Checked via token introspection.",
     )
+    token_introspection_cache_ttl: int = Field(
+        default=10,
+        ge=0,
+        description="Seconds to cache successful token introspection results (0 disables caching)",
+    )
 
     @property
     def keycloak_introspection_endpoint(self) -> str:
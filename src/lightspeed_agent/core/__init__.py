@@ -1,9 +1,10 @@
 """Core agent module."""
 
+from typing import Any
+
 from lightspeed_agent.core.agent import (
     AGENT_INSTRUCTION,
     create_agent,
-    root_agent,
 )
 
 __all__ = [
@@ -11,3 +12,12 @@ __all__ = [
     "create_agent",
     "root_agent",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    # root_agent is built lazily by lightspeed_agent.core.agent
+    if name == "root_agent":
+        from lightspeed_agent.core import agent
+
+        return agent.root_agent
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -2,6 +2,7 @@
 
 import logging
 import os
+from typing import Any
 
 from google.adk.agents import LlmAgent
 
@@ -64,18 +65,26 @@ When responding to users:
 
 
 def _setup_environment() -> None:
-    """Set up environment variables for Google ADK."""
+    """Set up environment variables for Google ADK.
+
+    Only variables whose value actually changes are written, since each
+    assignment to ``os.environ`` calls ``putenv``.
+    """
     settings = get_settings()
 
     # Configure Vertex AI or Google AI Studio
-    os.environ["GOOGLE_GENAI_USE_VERTEXAI"] = str(settings.google_genai_use_vertexai).upper()
+    env = {"GOOGLE_GENAI_USE_VERTEXAI": str(settings.google_genai_use_vertexai).upper()}
 
     if settings.google_genai_use_vertexai:
         if settings.google_cloud_project:
-            os.environ["GOOGLE_CLOUD_PROJECT"] = settings.google_cloud_project
-        os.environ["GOOGLE_CLOUD_LOCATION"] = settings.google_cloud_location
+            env["GOOGLE_CLOUD_PROJECT"] = settings.google_cloud_project
+        env["GOOGLE_CLOUD_LOCATION"] = settings.google_cloud_location
     elif settings.google_api_key:
-        os.environ["GOOGLE_API_KEY"] = settings.google_api_key
+        env["GOOGLE_API_KEY"] = settings.google_api_key
+
+    for key, value in env.items():
+        if os.environ.get(key) != value:
+            os.environ[key] = value
 
 
 def create_agent() -> LlmAgent:
@@ -96,11 +105,14 @@ def create_agent() -> LlmAgent:
 
     # Always attempt to create MCP toolset - credentials are resolved dynamically
     try:
+        # Imported here so a missing tools dependency yields an agent without
+        # MCP tools instead of breaking "import lightspeed_agent.core"
         from lightspeed_agent.tools import READ_ONLY_TOOLS, create_insights_toolset
 
         logger.info(
-            f"Creating MCP toolset with transport={settings.mcp_transport_mode}, "
-            f"url={settings.mcp_server_url}, dynamic_headers=True"
+            "Creating MCP toolset with transport=%s, url=%s, dynamic_headers=True",
+            settings.mcp_transport_mode,
+            settings.mcp_server_url,
         )
         tool_filter = READ_ONLY_TOOLS if settings.mcp_read_only else None
         mcp_toolset = create_insights_toolset(
@@ -109,11 +121,12 @@ def create_agent() -> LlmAgent:
         )
         tools = [mcp_toolset]
         logger.info(
-            f"Created agent with MCP tools (read_only={settings.mcp_read_only}, "
-            f"model={settings.gemini_model})"
+            "Created agent with MCP tools (read_only=%s, model=%s)",
+            settings.mcp_read_only,
+            settings.gemini_model,
         )
     except Exception as e:
-        logger.warning(f"Failed to create MCP toolset: {e}", exc_info=True)
+        logger.warning("Failed to create MCP toolset: %s", e, exc_info=True)
         logger.info("Agent created without MCP tools")
 
     return LlmAgent(
@@ -125,5 +138,16 @@ def create_agent() -> LlmAgent:
     )
 
 
-# Root agent instance for ADK CLI compatibility
-root_agent = create_agent()
+# Root agent instance for ADK CLI compatibility, created on first access
+# (PEP 562) so importing this module does not build the agent or its toolset
+_root_agent: LlmAgent | None = None
+
+
+def __getattr__(name: str) -> Any:
+    """Create ``root_agent`` on first access."""
+    global _root_agent
+    if name == "root_agent":
+        if _root_agent is None:
+            _root_agent = create_agent()
+        return _root_agent
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -24,6 +24,12 @@ class Base(DeclarativeBase):
     pass
 
 
+# Compiled SQL cache entries kept by the engine (SQLAlchemy default: 500)
+QUERY_CACHE_SIZE = 1200
+
+# Maximum age of a pooled connection before it is replaced
+POOL_RECYCLE_SECONDS = 1800
+
 # Global engine and session factory
 _engine: AsyncEngine | None = None
 _session_factory: async_sessionmaker[AsyncSession] | None = None
@@ -32,13 +38,17 @@ _session_factory: async_sessionmaker[AsyncSession] | None = None
 def get_engine() -> AsyncEngine:
     """Get the database engine, creating it if necessary.
 
+    Creation is synchronous, so concurrent coroutines on the event loop
+    cannot interleave between the check and the assignment; each worker
+    process gets exactly one engine.
+
     Returns:
         AsyncEngine instance.
     """
     global _engine
     if _engine is None:
         settings = get_settings()
-        engine_kwargs: dict = {"echo": settings.debug}
+        engine_kwargs: dict = {"echo": settings.debug, "query_cache_size": QUERY_CACHE_SIZE}
         if settings.database_url.startswith("sqlite"):
             from sqlalchemy.pool import StaticPool
 
@@ -47,6 +57,19 @@ def get_engine() -> AsyncEngine:
         else:
             engine_kwargs["pool_size"] = settings.database_pool_size
             engine_kwargs["max_overflow"] = settings.database_pool_max_overflow
+            # Detect connections dropped by proxies/NAT before handing them out,
+            # retire them before typical idle timeouts, and reuse the most
+            # recently returned (warm) connection first
+            engine_kwargs["pool_pre_ping"] = True
+            engine_kwargs["pool_recycle"] = POOL_RECYCLE_SECONDS
+            engine_kwargs["pool_use_lifo"] = True
+            if settings.database_url.startswith("postgresql+asyncpg"):
+                # Reuse server-side prepared statements across executions
+                cache_size = settings.database_statement_cache_size
+                engine_kwargs["connect_args"] = {
+                    "prepared_statement_cache_size": cache_size,
+                    "statement_cache_size": cache_size,
+                }
         _engine = create_async_engine(settings.database_url, **engine_kwargs)
         logger.info("Created database engine for %s", settings.database_url.split("@")[-1])
     return _engine
@@ -107,6 +130,7 @@ async def init_database(max_retries: int = 30, retry_delay: float = 2.0) -> None
             async with engine.begin() as conn:
                 await conn.run_sync(Base.metadata.create_all)
             logger.info("Database tables created/verified")
+            await _warm_pool(engine)
             return
         except Exception as e:
             last_error = e
@@ -130,6 +154,26 @@ async def init_database(max_retries: int = 30, retry_delay: float = 2.0) -> None
     raise RuntimeError(f"Failed to connect to database after {max_retries} attempts") from last_error
 
 
+async def _warm_pool(engine: AsyncEngine) -> None:
+    """Open the pool's connections up front so early requests don't pay connect latency.
+
+    Failures are logged and ignored; connections are then opened on demand.
+    """
+    settings = get_settings()
+    if settings.database_url.startswith("sqlite"):
+        return
+
+    async def _checkout() -> None:
+        async with engine.connect():
+            pass
+
+    try:
+        await asyncio.gather(*(_checkout() for _ in range(settings.database_pool_size)))
+        logger.info("Opened %d pooled database connections", settings.database_pool_size)
+    except Exception as e:
+        logger.warning("Failed to pre-open database connections: %s", e)
+
+
 async def close_database() -> None:
     """Close the database connection.
 
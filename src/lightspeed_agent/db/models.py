@@ -12,12 +12,15 @@ from sqlalchemy import (
     Text,
     func,
 )
-from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.dialects.postgresql import ARRAY, JSONB
 from sqlalchemy.orm import Mapped, mapped_column
 
 # Use ARRAY(String) on PostgreSQL, JSON on SQLite (for tests)
 StringList = ARRAY(String).with_variant(JSON, "sqlite")
 
+# Use JSONB on PostgreSQL (stored pre-parsed), JSON elsewhere
+JSONDict = JSON().with_variant(JSONB(), "postgresql")
+
 from lightspeed_agent.db.base import Base
 
 
@@ -40,7 +43,7 @@ class MarketplaceAccountModel(Base):
     )
     metadata_: Mapped[dict[str, Any]] = mapped_column(
         "metadata",
-        JSON,
+        JSONDict,
         default=dict,
     )
 
@@ -77,7 +80,7 @@ class MarketplaceEntitlementModel(Base):
     )
     metadata_: Mapped[dict[str, Any]] = mapped_column(
         "metadata",
-        JSON,
+        JSONDict,
         default=dict,
     )
 
@@ -110,7 +113,7 @@ class DCRClientModel(Base):
     )
     metadata_: Mapped[dict[str, Any]] = mapped_column(
         "metadata",
-        JSON,
+        JSONDict,
         default=dict,
     )
 
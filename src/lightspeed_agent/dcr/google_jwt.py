@@ -1,15 +1,18 @@
 """Google JWT validator for DCR software_statement verification."""
 
 import asyncio
+import hashlib
 import logging
 import time
-from typing import Any
+from collections import OrderedDict
 
 import httpx
 import jwt
+import orjson
 from cryptography import x509
-from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric.rsa import RSAPublicKey
 from jwt.exceptions import DecodeError, ExpiredSignatureError, InvalidTokenError
+from jwt.types import Options
 
 from lightspeed_agent.config import get_settings
 from lightspeed_agent.dcr.models import DCRError, DCRErrorCode, GoogleJWTClaims
@@ -22,24 +25,86 @@ GOOGLE_DCR_ISSUER = (
     "cloud-agentspace@system.gserviceaccount.com"
 )
 
+# Bounds applied to the Cache-Control max-age advertised by Google
+MIN_CERT_CACHE_TTL = 300
+MAX_CERT_CACHE_TTL = 86400
+
+# Minimum spacing between refreshes forced by an unknown key ID
+MIN_FORCED_REFRESH_INTERVAL = 60
+
+# Upper bound on cached validated software_statements (least recently used evicted)
+CLAIMS_CACHE_MAX_ENTRIES = 512
+
+# jwt.decode arguments. PyJWT merges the options into its own copy on every
+# call and only reads the algorithm list, so the shared values are never mutated.
+JWT_ALGORITHMS: list[str] = ["RS256"]
+JWT_DECODE_OPTIONS: Options = {
+    "verify_aud": True,
+    "verify_exp": True,
+    "verify_iat": True,
+    "require": ["iss", "iat", "exp", "aud", "sub"],
+}
+JWT_UNVERIFIED_DECODE_OPTIONS: Options = {
+    "verify_signature": False,
+    "verify_exp": False,
+    "verify_aud": False,
+}
+
+# Allowed clock skew (seconds) between us and Google for exp/iat checks
+JWT_LEEWAY = 30
+
+
+def _parse_max_age(cache_control: str | None) -> int | None:
+    """Extract the max-age directive (in seconds) from a Cache-Control header.
+
+    Args:
+        cache_control: Raw Cache-Control header value.
+
+    Returns:
+        The max-age value, or None if absent or malformed.
+    """
+    if not cache_control:
+        return None
+    for directive in cache_control.split(","):
+        name, _, value = directive.strip().partition("=")
+        if name.lower() == "max-age":
+            try:
+                return int(value.strip('"'))
+            except ValueError:
+                return None
+    return None
+
 
 class GoogleCertificateCache:
-    """Cache for Google's X.509 certificates used to sign software_statement JWTs."""
+    """Cache for Google's X.509 certificates used to sign software_statement JWTs.
+
+    A single ``httpx.AsyncClient`` is reused across refreshes so the
+    connection to googleapis.com is kept alive between fetches.
+    """
 
-    def __init__(self, cert_url: str = GOOGLE_DCR_ISSUER, cache_ttl: int = 3600):
+    def __init__(
+        self,
+        cert_url: str = GOOGLE_DCR_ISSUER,
+        cache_ttl: int = 3600,
+        http_client: httpx.AsyncClient | None = None,
+    ):
         """Initialize the certificate cache.
 
         Args:
             cert_url: URL to fetch Google's X.509 certificates.
             cache_ttl: Cache time-to-live in seconds (default: 1 hour).
+                Replaced by the response's Cache-Control max-age when present.
+            http_client: Optional HTTP client for testing.
         """
         self._cert_url = cert_url
         self._cache_ttl = cache_ttl
-        self._certificates: dict[str, Any] = {}
-        self._last_fetch: float = 0
+        self._http_client = http_client
+        self._certificates: dict[str, RSAPublicKey] = {}
+        self._expires_at: float = 0.0
+        self._fetched_at: float = float("-inf")
         self._lock = asyncio.Lock()
 
-    async def get_public_key(self, kid: str) -> Any | None:
+    async def get_public_key(self, kid: str) -> RSAPublicKey | None:
         """Get the public key for a given key ID.
 
         Args:
@@ -52,57 +117,102 @@ class GoogleCertificateCache:
         return self._certificates.get(kid)
 
     async def _ensure_fresh(self) -> None:
-        """Ensure the cache is fresh, fetching new certificates if needed."""
-        current_time = time.monotonic()
-        if current_time - self._last_fetch < self._cache_ttl and self._certificates:
+        """Ensure the cache is fresh, fetching new certificates if needed.
+
+        The steady-state path is a single timestamp comparison; the lock is
+        only taken when the certificates are missing or stale.
+        """
+        if time.monotonic() < self._expires_at:
             return
 
         async with self._lock:
-            # Double-check after acquiring lock
-            if current_time - self._last_fetch < self._cache_ttl and self._certificates:
+            # Another task may have refreshed while we waited for the lock
+            if time.monotonic() < self._expires_at:
                 return
 
             await self._fetch_certificates()
 
+    def _get_http_client(self) -> httpx.AsyncClient:
+        """Get the pooled HTTP client (lazy initialization)."""
+        if self._http_client is None:
+            self._http_client = httpx.AsyncClient(
+                timeout=10.0,
+                limits=httpx.Limits(max_keepalive_connections=2),
+            )
+        return self._http_client
+
     async def _fetch_certificates(self) -> None:
         """Fetch certificates from Google's endpoint."""
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(self._cert_url, timeout=10.0)
-                response.raise_for_status()
-                certs_data = response.json()
+            response = await self._get_http_client().get(self._cert_url, timeout=10.0)
+            response.raise_for_status()
+            certs_data = orjson.loads(response.content)
+            max_age = _parse_max_age(response.headers.get("cache-control"))
 
             self._certificates = {}
             for kid, cert_pem in certs_data.items():
                 try:
-                    # Parse X.509 certificate and extract public key
+                    # Keep the parsed key object; PyJWT accepts it directly,
+                    # so no PEM round trip is needed per validation
                     cert = x509.load_pem_x509_certificate(cert_pem.encode())
                     public_key = cert.public_key()
-                    # Convert to PEM format for jose library
-                    pem = public_key.public_bytes(
-                        encoding=serialization.Encoding.PEM,
-                        format=serialization.PublicFormat.SubjectPublicKeyInfo,
-                    )
-                    self._certificates[kid] = pem.decode()
                 except Exception as e:
                     logger.warning("Failed to parse certificate for kid %s: %s", kid, e)
-
-            self._last_fetch = time.monotonic()
-            logger.info("Fetched %d certificates from Google", len(self._certificates))
+                    continue
+                if not isinstance(public_key, RSAPublicKey):
+                    # Only RS256 is accepted, so other key types can never verify
+                    logger.warning("Skipping non-RSA certificate for kid %s", kid)
+                    continue
+                self._certificates[kid] = public_key
+
+            if max_age is not None:
+                # Refresh when Google says the certificates go stale
+                self._cache_ttl = min(max(max_age, MIN_CERT_CACHE_TTL), MAX_CERT_CACHE_TTL)
+
+            if self._certificates:
+                self._fetched_at = time.monotonic()
+                self._expires_at = self._fetched_at + self._cache_ttl
+            logger.info(
+                "Fetched %d certificates from Google (cache_ttl=%ds)",
+                len(self._certificates),
+                self._cache_ttl,
+            )
 
         except httpx.HTTPError as e:
             logger.error("Failed to fetch Google certificates: %s", e)
             if not self._certificates:
                 raise RuntimeError(f"Failed to fetch certificates: {e}") from e
 
+    async def prefetch(self) -> None:
+        """Load the certificates now if the cache is empty or stale."""
+        await self._ensure_fresh()
+
     async def force_refresh(self) -> None:
-        """Force a refresh of the certificate cache."""
-        self._last_fetch = 0
+        """Force a refresh of the certificate cache.
+
+        Refreshes are triggered by JWTs carrying an unknown key ID, which
+        anyone can mint, so they are limited to one per
+        ``MIN_FORCED_REFRESH_INTERVAL`` seconds after a successful fetch.
+        """
+        if time.monotonic() - self._fetched_at < MIN_FORCED_REFRESH_INTERVAL:
+            return
+        self._expires_at = 0.0
         await self._ensure_fresh()
 
+    async def close(self) -> None:
+        """Close the pooled HTTP client, if one was created."""
+        if self._http_client is not None:
+            await self._http_client.aclose()
+            self._http_client = None
+
 
 class GoogleJWTValidator:
-    """Validator for Google's software_statement JWT in DCR requests."""
+    """Validator for Google's software_statement JWT in DCR requests.
+
+    Successfully validated statements are cached until their ``exp``,
+    keyed by the SHA-256 digest of the JWT, so a statement replayed during
+    a registration flow skips signature verification.
+    """
 
     def __init__(self, expected_audience: str | None = None):
         """Initialize the validator.
@@ -114,6 +224,20 @@ class GoogleJWTValidator:
         self._settings = get_settings()
         self._expected_audience = expected_audience or self._settings.agent_provider_url
         self._cert_cache = GoogleCertificateCache()
+        self._claims_cache: OrderedDict[bytes, GoogleJWTClaims] = OrderedDict()
+
+    async def warm_up(self) -> None:
+        """Fetch Google's certificates ahead of the first DCR request.
+
+        Does nothing in development mode, where signatures are not checked.
+        """
+        if self._settings.skip_jwt_validation:
+            return
+        await self._cert_cache.prefetch()
+
+    async def close(self) -> None:
+        """Release the certificate cache's HTTP connections."""
+        await self._cert_cache.close()
 
     async def _decode_without_verification(
         self,
@@ -128,12 +252,8 @@ class GoogleJWTValidator:
         try:
             claims = jwt.decode(
                 software_statement,
-                options={
-                    "verify_signature": False,
-                    "verify_exp": False,
-                    "verify_aud": False,
-                },
-                algorithms=["RS256"],
+                options=JWT_UNVERIFIED_DECODE_OPTIONS,
+                algorithms=JWT_ALGORITHMS,
             )
         except DecodeError as e:
             return DCRError(
@@ -149,7 +269,7 @@ class GoogleJWTValidator:
             )
 
         try:
-            jwt_claims = GoogleJWTClaims(**claims)
+            jwt_claims = GoogleJWTClaims.model_validate(claims)
         except Exception as e:
             return DCRError(
                 error=DCRErrorCode.INVALID_SOFTWARE_STATEMENT,
@@ -178,6 +298,11 @@ class GoogleJWTValidator:
         if self._settings.skip_jwt_validation:
             return await self._decode_without_verification(software_statement)
 
+        cache_key = hashlib.sha256(software_statement.encode()).digest()
+        cached = self._get_cached_claims(cache_key)
+        if cached is not None:
+            return cached
+
         try:
             # Decode header to get key ID
             unverified_header = jwt.get_unverified_header(software_statement)
@@ -221,14 +346,10 @@ class GoogleJWTValidator:
             claims = jwt.decode(
                 software_statement,
                 public_key,
-                algorithms=["RS256"],
+                algorithms=JWT_ALGORITHMS,
                 audience=self._expected_audience,
-                options={
-                    "verify_aud": True,
-                    "verify_exp": True,
-                    "verify_iat": True,
-                    "require": ["iss", "iat", "exp", "aud", "sub"],
-                },
+                options=JWT_DECODE_OPTIONS,
+                leeway=JWT_LEEWAY,
             )
         except ExpiredSignatureError:
             logger.warning("Software statement JWT has expired")
@@ -260,7 +381,7 @@ class GoogleJWTValidator:
 
         # Parse claims into model
         try:
-            jwt_claims = GoogleJWTClaims(**claims)
+            jwt_claims = GoogleJWTClaims.model_validate(claims)
         except Exception as e:
             logger.warning("Failed to parse JWT claims: %s", e)
             return DCRError(
@@ -273,8 +394,27 @@ class GoogleJWTValidator:
             jwt_claims.order_id,
             jwt_claims.account_id,
         )
+        self._store_claims(cache_key, jwt_claims)
         return jwt_claims
 
+    def _get_cached_claims(self, key: bytes) -> GoogleJWTClaims | None:
+        """Return cached claims for a statement digest if not yet expired."""
+        claims = self._claims_cache.get(key)
+        if claims is None:
+            return None
+        if claims.exp <= time.time():
+            del self._claims_cache[key]
+            return None
+        self._claims_cache.move_to_end(key)
+        return claims
+
+    def _store_claims(self, key: bytes, claims: GoogleJWTClaims) -> None:
+        """Cache validated claims, evicting the least recently used entry."""
+        self._claims_cache[key] = claims
+        self._claims_cache.move_to_end(key)
+        if len(self._claims_cache) > CLAIMS_CACHE_MAX_ENTRIES:
+            self._claims_cache.popitem(last=False)
+
 
 # Global validator instance
 _google_jwt_validator: GoogleJWTValidator | None = None
@@ -290,3 +430,9 @@ def get_google_jwt_validator() -> GoogleJWTValidator:
     if _google_jwt_validator is None:
         _google_jwt_validator = GoogleJWTValidator()
     return _google_jwt_validator
+
+
+async def close_google_jwt_validator() -> None:
+    """Close the global validator's HTTP client on shutdown."""
+    if _google_jwt_validator is not None:
+        await _google_jwt_validator.close()
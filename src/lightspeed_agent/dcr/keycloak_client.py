@@ -1,16 +1,30 @@
 """Keycloak DCR client for creating real OAuth clients in Red Hat SSO."""
 
 import logging
+import time
 from dataclasses import dataclass
+from typing import Any
 
 import httpx
+import orjson
 
 from lightspeed_agent.config import get_settings
 
 logger = logging.getLogger(__name__)
 
+# Refresh the cached admin token this many seconds before it expires
+ADMIN_TOKEN_EXPIRY_MARGIN = 30
 
-@dataclass
+# Retries for failed connection attempts to Red Hat SSO. httpx only retries
+# when no connection was established, so the non-idempotent DCR POST is safe.
+# Applied to direct connections only: the retrying transport is mounted
+# rather than passed as ``transport=``, which would disable HTTP(S)_PROXY.
+CONNECT_RETRIES = 3
+
+DEFAULT_GRANT_TYPES = ["authorization_code", "refresh_token", "client_credentials"]
+
+
+@dataclass(slots=True)
 class KeycloakClientResponse:
     """Response from Keycloak DCR endpoint."""
 
@@ -38,6 +52,9 @@ class KeycloakDCRClient:
     POST /realms/{realm}/clients-registrations/openid-connect
 
     Requires an Initial Access Token (IAT) from Keycloak admin.
+
+    A single ``httpx.AsyncClient`` is shared by the DCR and Admin API calls
+    so connections to Red Hat SSO are kept alive between registrations.
     """
 
     def __init__(
@@ -56,11 +73,42 @@ class KeycloakDCRClient:
             http_client: Optional HTTP client for testing.
         """
         settings = get_settings()
+        self._settings = settings
         self._dcr_endpoint = dcr_endpoint or settings.keycloak_dcr_endpoint
         self._initial_access_token = initial_access_token or settings.dcr_initial_access_token
         self._client_name_prefix = client_name_prefix or settings.dcr_client_name_prefix
         self._http_client = http_client
 
+        # Per-client constants of every DCR request, built once
+        self._dcr_headers = {
+            "Authorization": f"Bearer {self._initial_access_token}",
+            "Content-Type": "application/json",
+        }
+        self._dcr_request_defaults = {
+            "grant_types": DEFAULT_GRANT_TYPES,
+            "token_endpoint_auth_method": "client_secret_basic",
+            "application_type": "web",
+            "scope": settings.agent_required_scope,
+        }
+
+        self._admin_token: str | None = None
+        self._admin_token_expires_at: float = 0.0
+
+    def _get_http_client(self) -> httpx.AsyncClient:
+        """Get the pooled HTTP client (lazy initialization)."""
+        if self._http_client is None:
+            self._http_client = httpx.AsyncClient(
+                timeout=30.0,
+                mounts={"all://": httpx.AsyncHTTPTransport(retries=CONNECT_RETRIES)},
+            )
+        return self._http_client
+
+    async def close(self) -> None:
+        """Close the pooled HTTP client, if one was created."""
+        if self._http_client is not None:
+            await self._http_client.aclose()
+            self._http_client = None
+
     async def create_client(
         self,
         order_id: str,
@@ -72,7 +120,8 @@ class KeycloakDCRClient:
         Args:
             order_id: The marketplace order ID (used in client name).
             redirect_uris: OAuth redirect URIs for the client.
-            grant_types: OAuth grant types. Defaults to authorization_code, refresh_token.
+            grant_types: OAuth grant types. Defaults to authorization_code,
+                refresh_token, client_credentials.
 
         Returns:
             KeycloakClientResponse with client credentials.
@@ -88,47 +137,31 @@ class KeycloakDCRClient:
 
         client_name = f"{self._client_name_prefix}{order_id}"
 
-        settings = get_settings()
-
         request_body = {
+            **self._dcr_request_defaults,
             "client_name": client_name,
             "redirect_uris": redirect_uris or [],
-            "grant_types": grant_types or ["authorization_code", "refresh_token", "client_credentials"],
-            "token_endpoint_auth_method": "client_secret_basic",
-            "application_type": "web",
-            "scope": settings.agent_required_scope,
         }
+        if grant_types:
+            request_body["grant_types"] = grant_types
 
-        headers = {
-            "Authorization": f"Bearer {self._initial_access_token}",
-            "Content-Type": "application/json",
-        }
-
-        logger.info(
+        logger.debug(
             "Creating OAuth client in Keycloak: %s",
             client_name,
         )
 
         try:
-            if self._http_client:
-                response = await self._http_client.post(
-                    self._dcr_endpoint,
-                    json=request_body,
-                    headers=headers,
-                )
-            else:
-                async with httpx.AsyncClient() as client:
-                    response = await client.post(
-                        self._dcr_endpoint,
-                        json=request_body,
-                        headers=headers,
-                        timeout=30.0,
-                    )
+            response = await self._get_http_client().post(
+                self._dcr_endpoint,
+                content=orjson.dumps(request_body),
+                headers=self._dcr_headers,
+            )
 
             if response.status_code == 201:
-                data = response.json()
+                data = orjson.loads(response.content)
                 oauth_client_id = data["client_id"]
-                logger.info(
+                # DCRService logs the successful registration at INFO
+                logger.debug(
                     "Successfully created OAuth client: %s (client_id=%s)",
                     client_name,
                     oauth_client_id,
@@ -137,7 +170,7 @@ class KeycloakDCRClient:
                 # Keycloak's OIDC DCR endpoint does not set
                 # serviceAccountsEnabled even when client_credentials is
                 # in grant_types.  Enable it via the Admin API.
-                await self._enable_service_accounts(oauth_client_id, settings)
+                await self._enable_service_accounts(oauth_client_id)
 
                 return KeycloakClientResponse(
                     client_id=oauth_client_id,
@@ -151,7 +184,7 @@ class KeycloakDCRClient:
             # Handle errors
             error_data = {}
             try:
-                error_data = response.json()
+                error_data = orjson.loads(response.content)
             except Exception:
                 error_data = {"error": response.text}
 
@@ -168,13 +201,80 @@ class KeycloakDCRClient:
             )
 
         except httpx.RequestError as e:
-            logger.exception("HTTP error calling Keycloak DCR: %s", e)
+            # Logged with its traceback by the caller; don't log it twice
             raise KeycloakDCRError(
                 f"HTTP error calling Keycloak DCR: {e}",
                 status_code=500,
             ) from e
 
-    async def _enable_service_accounts(self, oauth_client_id: str, settings) -> None:
+    async def _get_admin_token(self) -> str | None:
+        """Get an Admin API token using the agent's own credentials.
+
+        The token is reused until shortly before its ``expires_in`` elapses,
+        so back-to-back registrations do not each pay for a token grant.
+
+        Returns:
+            The access token, or None if the grant failed.
+        """
+        if self._admin_token and time.monotonic() < self._admin_token_expires_at:
+            return self._admin_token
+
+        settings = self._settings
+        token_resp = await self._get_http_client().post(
+            settings.keycloak_token_endpoint,
+            data={
+                "grant_type": "client_credentials",
+                "client_id": settings.red_hat_sso_client_id,
+                "client_secret": settings.red_hat_sso_client_secret,
+            },
+        )
+        if token_resp.status_code != 200:
+            logger.warning(
+                "Failed to get Admin API token (status %d)",
+                token_resp.status_code,
+            )
+            return None
+
+        data = orjson.loads(token_resp.content)
+        self._admin_token = data["access_token"]
+        expires_in = data.get("expires_in", 0)
+        self._admin_token_expires_at = (
+            time.monotonic() + expires_in - ADMIN_TOKEN_EXPIRY_MARGIN
+        )
+        return self._admin_token
+
+    async def _admin_request(
+        self,
+        method: str,
+        url: str,
+        headers: dict[str, str] | None = None,
+        **kwargs: Any,
+    ) -> httpx.Response | None:
+        """Send an Admin API request authorized with the cached admin token.
+
+        A 401 means the token was revoked or expired early, so it is dropped
+        and the request is retried once with a freshly granted token.
+
+        Returns:
+            The response, or None if no admin token could be obtained.
+        """
+        http = self._get_http_client()
+        for attempt in range(2):
+            admin_token = await self._get_admin_token()
+            if not admin_token:
+                return None
+            response = await http.request(
+                method,
+                url,
+                headers={**(headers or {}), "Authorization": f"Bearer {admin_token}"},
+                **kwargs,
+            )
+            if response.status_code != 401 or attempt:
+                return response
+            self._admin_token = None
+        return None
+
+    async def _enable_service_accounts(self, oauth_client_id: str) -> None:
         """Enable service accounts on a DCR-created client via Admin API.
 
         Keycloak's OIDC DCR endpoint does not set ``serviceAccountsEnabled``
@@ -184,78 +284,65 @@ class KeycloakDCRClient:
         Requires the agent's client to have the ``manage-clients`` realm role.
         Failures are logged but do not block the DCR response.
         """
-        admin_base = settings.keycloak_admin_api_base
-        token_url = settings.keycloak_token_endpoint
+        admin_base = self._settings.keycloak_admin_api_base
 
         try:
-            async with httpx.AsyncClient() as http:
-                # 1. Get a token using the agent's own credentials
-                token_resp = await http.post(
-                    token_url,
-                    data={
-                        "grant_type": "client_credentials",
-                        "client_id": settings.red_hat_sso_client_id,
-                        "client_secret": settings.red_hat_sso_client_secret,
-                    },
-                    timeout=30.0,
+            # 1. Look up the client by OAuth client_id
+            lookup_resp = await self._admin_request(
+                "GET",
+                f"{admin_base}/clients",
+                params={"clientId": oauth_client_id},
+            )
+            if lookup_resp is None:
+                logger.warning(
+                    "Cannot enable service accounts on %s: no admin token",
+                    oauth_client_id,
+                )
+                return
+            clients = orjson.loads(lookup_resp.content) if lookup_resp.status_code == 200 else []
+            if not clients:
+                logger.warning(
+                    "Cannot enable service accounts: "
+                    "client %s not found in Admin API",
+                    oauth_client_id,
+                )
+                return
+
+            kc_uuid = clients[0]["id"]
+
+            # 2. Enable service accounts. Keycloak only applies the fields
+            # present in the representation, so the full client need not
+            # be sent back.
+            update_resp = await self._admin_request(
+                "PUT",
+                f"{admin_base}/clients/{kc_uuid}",
+                content=b'{"serviceAccountsEnabled":true}',
+                headers={"Content-Type": "application/json"},
+            )
+            if update_resp is None:
+                logger.warning(
+                    "Cannot enable service accounts on %s: no admin token",
+                    oauth_client_id,
                 )
-                if token_resp.status_code != 200:
-                    logger.warning(
-                        "Cannot enable service accounts on %s: "
-                        "failed to get admin token (status %d)",
-                        oauth_client_id,
-                        token_resp.status_code,
-                    )
-                    return
-
-                admin_token = token_resp.json()["access_token"]
-                admin_headers = {"Authorization": f"Bearer {admin_token}"}
-
-                # 2. Look up the client by OAuth client_id
-                lookup_resp = await http.get(
-                    f"{admin_base}/clients",
-                    params={"clientId": oauth_client_id},
-                    headers=admin_headers,
-                    timeout=30.0,
+            elif update_resp.status_code == 204:
+                logger.info(
+                    "Enabled service accounts on client %s",
+                    oauth_client_id,
                 )
-                clients = lookup_resp.json() if lookup_resp.status_code == 200 else []
-                if not clients:
-                    logger.warning(
-                        "Cannot enable service accounts: "
-                        "client %s not found in Admin API",
-                        oauth_client_id,
-                    )
-                    return
-
-                kc_client = clients[0]
-                kc_uuid = kc_client["id"]
-
-                # 3. Enable service accounts (PUT requires full representation)
-                kc_client["serviceAccountsEnabled"] = True
-                update_resp = await http.put(
-                    f"{admin_base}/clients/{kc_uuid}",
-                    json=kc_client,
-                    headers={**admin_headers, "Content-Type": "application/json"},
-                    timeout=30.0,
+            else:
+                logger.warning(
+                    "Failed to enable service accounts on %s: %d %s",
+                    oauth_client_id,
+                    update_resp.status_code,
+                    update_resp.text,
                 )
-                if update_resp.status_code == 204:
-                    logger.info(
-                        "Enabled service accounts on client %s",
-                        oauth_client_id,
-                    )
-                else:
-                    logger.warning(
-                        "Failed to enable service accounts on %s: %d %s",
-                        oauth_client_id,
-                        update_resp.status_code,
-                        update_resp.text,
-                    )
         except Exception:
             logger.exception(
                 "Error enabling service accounts on client %s",
                 oauth_client_id,
             )
 
+
 # Global client instance
 _keycloak_client: KeycloakDCRClient | None = None
 
@@ -270,3 +357,9 @@ def get_keycloak_dcr_client() -> KeycloakDCRClient:
     if _keycloak_client is None:
         _keycloak_client = KeycloakDCRClient()
     return _keycloak_client
+
+
+async def close_keycloak_dcr_client() -> None:
+    """Close the global Keycloak DCR client's HTTP client on shutdown."""
+    if _keycloak_client is not None:
+        await _keycloak_client.close()
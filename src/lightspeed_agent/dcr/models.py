@@ -4,7 +4,7 @@ from datetime import datetime
 from enum import Enum
 from typing import Any
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class DCRErrorCode(str, Enum):
@@ -34,9 +34,13 @@ class GoogleClaims(BaseModel):
 class GoogleJWTClaims(BaseModel):
     """Claims from Google's software_statement JWT.
 
-    Based on the Google Cloud Marketplace DCR specification.
+    Based on the Google Cloud Marketplace DCR specification. Unknown claims
+    are accepted per spec but not retained, since nothing reads them.
+    Frozen so validated claims can be cached and shared.
     """
 
+    model_config = ConfigDict(extra="ignore", frozen=True)
+
     iss: str = Field(
         ...,
         description="Issuer - Google's service account URL",
@@ -66,9 +70,6 @@ class GoogleJWTClaims(BaseModel):
         description="Google-specific claims",
     )
 
-    class Config:
-        extra = "allow"  # Allow unknown fields per spec
-
     @property
     def order_id(self) -> str:
         """Get the Order ID from Google claims."""
@@ -1,5 +1,6 @@
 """DCR service for handling Dynamic Client Registration requests."""
 
+import asyncio
 import logging
 
 import httpx
@@ -35,6 +36,11 @@ class DCRService:
     - Creates OAuth client credentials (real DCR or static)
     - Returns RFC 7591 compliant responses
 
+    Response and error models are built with ``model_construct``: every
+    field comes from values this service already validated (JWT claims,
+    Keycloak output, stored records), so re-running Pydantic validation
+    on the way out only costs time.
+
     Modes:
     - DCR_ENABLED=true: Creates real OAuth clients in Red Hat SSO (Keycloak)
     - DCR_ENABLED=false: Accepts static credentials (client_id + client_secret)
@@ -63,13 +69,9 @@ class DCRService:
         self._client_repository = client_repository or get_dcr_client_repository()
         self._settings = get_settings()
 
-        # Fernet cipher for encrypting client secrets
-        self._fernet: Fernet | None = None
-        if self._settings.dcr_encryption_key:
-            try:
-                self._fernet = Fernet(self._settings.dcr_encryption_key.encode())
-            except Exception as e:
-                logger.error("Invalid DCR encryption key: %s", e)
+        # Fernet cipher for encrypting client secrets, ready before the
+        # first request so concurrent registrations share one key
+        self._fernet = self._create_fernet()
 
     def _get_keycloak_client(self) -> KeycloakDCRClient:
         """Get the Keycloak DCR client (lazy initialization)."""
@@ -77,6 +79,20 @@ class DCRService:
             self._keycloak_client = get_keycloak_dcr_client()
         return self._keycloak_client
 
+    def _create_fernet(self) -> Fernet:
+        """Create the Fernet cipher from DCR_ENCRYPTION_KEY.
+
+        Falls back to an ephemeral key when the setting is missing or
+        invalid; secrets stored with it cannot be decrypted after a restart.
+        """
+        if self._settings.dcr_encryption_key:
+            try:
+                return Fernet(self._settings.dcr_encryption_key.encode())
+            except Exception as e:
+                logger.error("Invalid DCR encryption key: %s", e)
+        logger.warning("DCR_ENCRYPTION_KEY not set or invalid, using ephemeral key")
+        return Fernet(Fernet.generate_key())
+
     def _encrypt_secret(self, secret: str) -> str:
         """Encrypt a client secret for storage.
 
@@ -86,9 +102,6 @@ class DCRService:
         Returns:
             Encrypted secret as base64 string.
         """
-        if not self._fernet:
-            logger.warning("DCR_ENCRYPTION_KEY not set, using ephemeral key")
-            self._fernet = Fernet(Fernet.generate_key())
         return self._fernet.encrypt(secret.encode()).decode()
 
     def _decrypt_secret(self, encrypted_secret: str) -> str | None:
@@ -100,9 +113,6 @@ class DCRService:
         Returns:
             Decrypted secret or None if decryption fails.
         """
-        if not self._fernet:
-            logger.error("Cannot decrypt: no encryption key available")
-            return None
         try:
             return self._fernet.decrypt(encrypted_secret.encode()).decode()
         except InvalidToken:
@@ -133,18 +143,23 @@ class DCRService:
 
         claims: GoogleJWTClaims = validation_result
 
-        # Step 2: Validate the Procurement Account ID
-        if not await self._validate_account(claims.account_id):
+        # Steps 2-3: Validate the Procurement Account ID and Order ID.
+        # Independent lookups, so run them concurrently.
+        account_ok, order_ok = await asyncio.gather(
+            self._validate_account(claims.account_id),
+            self._validate_order(claims.order_id),
+        )
+
+        if not account_ok:
             logger.warning("Invalid Procurement Account ID: %s", claims.account_id)
-            return DCRError(
+            return DCRError.model_construct(
                 error=DCRErrorCode.UNAPPROVED_SOFTWARE_STATEMENT,
                 error_description=f"Invalid Procurement Account ID: {claims.account_id}",
             )
 
-        # Step 3: Validate the Order ID
-        if not await self._validate_order(claims.order_id):
+        if not order_ok:
             logger.warning("Invalid Order ID: %s", claims.order_id)
-            return DCRError(
+            return DCRError.model_construct(
                 error=DCRErrorCode.UNAPPROVED_SOFTWARE_STATEMENT,
                 error_description=f"Invalid Order ID: {claims.order_id}",
             )
@@ -252,7 +267,7 @@ class DCRService:
                 "in the request body (order: %s)",
                 claims.order_id,
             )
-            return DCRError(
+            return DCRError.model_construct(
                 error=DCRErrorCode.INVALID_CLIENT_METADATA,
                 error_description=(
                     "Static credentials mode: both client_id and client_secret "
@@ -262,7 +277,7 @@ class DCRService:
 
         # Validate credentials against Red Hat SSO
         if not await self._validate_credentials(request.client_id, request.client_secret):
-            return DCRError(
+            return DCRError.model_construct(
                 error=DCRErrorCode.INVALID_CLIENT_METADATA,
                 error_description=(
                     f"Invalid client credentials: client_id={request.client_id} "
@@ -289,7 +304,7 @@ class DCRService:
             )
         except Exception as e:
             logger.exception("Failed to store static credentials: %s", e)
-            return DCRError(
+            return DCRError.model_construct(
                 error=DCRErrorCode.SERVER_ERROR,
                 error_description=f"Failed to store client credentials: {e}",
             )
@@ -300,7 +315,7 @@ class DCRService:
             request.client_id,
         )
 
-        return DCRResponse(
+        return DCRResponse.model_construct(
             client_id=request.client_id,
             client_secret=request.client_secret,
             client_secret_expires_at=0,
@@ -321,12 +336,12 @@ class DCRService:
                 "Failed to decrypt secret for client %s",
                 existing_client.client_id,
             )
-            return DCRError(
+            return DCRError.model_construct(
                 error=DCRErrorCode.SERVER_ERROR,
                 error_description="Failed to retrieve existing credentials",
             )
 
-        return DCRResponse(
+        return DCRResponse.model_construct(
             client_id=existing_client.client_id,
             client_secret=client_secret,
             client_secret_expires_at=0,
@@ -387,7 +402,7 @@ class DCRService:
                 response.client_id,
             )
 
-            return DCRResponse(
+            return DCRResponse.model_construct(
                 client_id=response.client_id,
                 client_secret=response.client_secret,
                 client_secret_expires_at=0,
@@ -395,13 +410,13 @@ class DCRService:
 
         except KeycloakDCRError as e:
             logger.exception("Keycloak DCR error: %s", e)
-            return DCRError(
+            return DCRError.model_construct(
                 error=DCRErrorCode.SERVER_ERROR,
                 error_description=f"Failed to create OAuth client: {e}",
             )
         except Exception as e:
             logger.exception("Unexpected error creating client: %s", e)
-            return DCRError(
+            return DCRError.model_construct(
                 error=DCRErrorCode.SERVER_ERROR,
                 error_description=f"Failed to create client: {e}",
             )
@@ -0,0 +1,51 @@
+"""Log formatting and handlers shared by the agent and marketplace handler."""
+
+import atexit
+import logging
+import queue
+import sys
+from logging.handlers import QueueHandler, QueueListener
+
+import orjson
+
+TEXT_LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+
+
+class JSONFormatter(logging.Formatter):
+    """Format log records as one JSON object per line.
+
+    Serializing with orjson escapes quotes and newlines in the message,
+    which a %-style JSON template cannot, and includes tracebacks.
+    """
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "time": self.formatTime(record),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        if record.exc_info:
+            entry["exc_info"] = self.formatException(record.exc_info)
+        if record.stack_info:
+            entry["stack_info"] = self.formatStack(record.stack_info)
+        return orjson.dumps(entry).decode()
+
+
+def create_log_handler(log_format: str) -> logging.Handler:
+    """Create the log handler for the given LOG_FORMAT ("json" or "text").
+
+    Records are formatted by the logging thread but written to stdout by a
+    background QueueListener, so a slow log pipe never blocks the event loop.
+    The listener is stopped, flushing queued records, at interpreter exit.
+    """
+    log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+    listener = QueueListener(log_queue, logging.StreamHandler(sys.stdout))
+    listener.start()
+    atexit.register(listener.stop)
+
+    handler = QueueHandler(log_queue)
+    handler.setFormatter(
+        JSONFormatter() if log_format == "json" else logging.Formatter(TEXT_LOG_FORMAT)
+    )
+    return handler
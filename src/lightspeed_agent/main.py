@@ -1,29 +1,21 @@
 """Main entry point for the Lightspeed Agent."""
 
 import logging
-import sys
 
 import uvicorn
 from dotenv import load_dotenv
 
 from lightspeed_agent.config import get_settings
+from lightspeed_agent.logging_config import create_log_handler
 
 
 def setup_logging() -> None:
     """Configure application logging."""
     settings = get_settings()
 
-    log_format = (
-        '{"time": "%(asctime)s", "level": "%(levelname)s", '
-        '"logger": "%(name)s", "message": "%(message)s"}'
-        if settings.log_format == "json"
-        else "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-    )
-
     logging.basicConfig(
         level=getattr(logging, settings.log_level.upper()),
-        format=log_format,
-        handlers=[logging.StreamHandler(sys.stdout)],
+        handlers=[create_log_handler(settings.log_format)],
     )
 
 
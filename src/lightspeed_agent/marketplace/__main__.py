@@ -6,6 +6,7 @@ import os
 import uvicorn
 
 from lightspeed_agent.config import get_settings
+from lightspeed_agent.logging_config import create_log_handler
 
 
 def main():
@@ -16,22 +17,13 @@ def main():
     log_level = os.getenv("LOG_LEVEL", "INFO").upper()
     log_format = os.getenv("LOG_FORMAT", "text")
 
-    if log_format == "json":
-        logging.basicConfig(
-            level=log_level,
-            format='{"time": "%(asctime)s", "level": "%(levelname)s", "logger": "%(name)s", "message": "%(message)s"}',
-        )
-    else:
-        logging.basicConfig(
-            level=log_level,
-            format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-        )
+    logging.basicConfig(level=log_level, handlers=[create_log_handler(log_format)])
 
     # Get host and port from environment
     host = os.getenv("HANDLER_HOST", "0.0.0.0")
     port = int(os.getenv("HANDLER_PORT", "8001"))
 
-    logging.info(f"Starting Marketplace Handler on {host}:{port}")
+    logging.info("Starting Marketplace Handler on %s:%d", host, port)
 
     uvicorn.run(
         "lightspeed_agent.marketplace.app:create_app",
@@ -11,6 +11,7 @@ using smart routing based on request content.
 import logging
 from contextlib import asynccontextmanager
 
+from a2a.extensions.common import HTTP_EXTENSION_HEADER
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
@@ -36,6 +37,15 @@ async def lifespan(app: FastAPI):
         logger.error("Failed to initialize database: %s", e)
         raise
 
+    # Startup: Warm Google's certificate cache so the first DCR request
+    # doesn't pay the fetch in-band (it is retried on demand if this fails)
+    try:
+        from lightspeed_agent.dcr import get_google_jwt_validator
+
+        await get_google_jwt_validator().warm_up()
+    except Exception as e:
+        logger.warning("Failed to prefetch Google certificates: %s", e)
+
     yield
 
     # Shutdown: Close database connection
@@ -47,6 +57,30 @@ async def lifespan(app: FastAPI):
     except Exception as e:
         logger.error("Failed to close database: %s", e)
 
+    # Shutdown: Close pooled Google certificate HTTP connections
+    try:
+        from lightspeed_agent.dcr.google_jwt import close_google_jwt_validator
+
+        await close_google_jwt_validator()
+    except Exception as e:
+        logger.error("Failed to close Google JWT validator: %s", e)
+
+    # Shutdown: Close pooled Red Hat SSO HTTP connections
+    try:
+        from lightspeed_agent.dcr.keycloak_client import close_keycloak_dcr_client
+
+        await close_keycloak_dcr_client()
+    except Exception as e:
+        logger.error("Failed to close Keycloak DCR client: %s", e)
+
+    # Shutdown: Close pooled Procurement API HTTP connections
+    try:
+        from lightspeed_agent.marketplace.service import close_procurement_service
+
+        await close_procurement_service()
+    except Exception as e:
+        logger.error("Failed to close procurement service: %s", e)
+
 
 def create_app() -> FastAPI:
     """Create and configure the Marketplace Handler FastAPI application.
@@ -84,10 +118,12 @@ def create_app() -> FastAPI:
     # Add CORS middleware
     app.add_middleware(
         CORSMiddleware,
-        allow_origins=["*"],
-        allow_credentials=True,
-        allow_methods=["*"],
-        allow_headers=["*"],
+        allow_origins=settings.cors_allowed_origins,
+        allow_credentials="*" not in settings.cors_allowed_origins,
+        allow_methods=["GET", "POST", "OPTIONS"],
+        # A2A clients negotiate extensions (e.g. DCR) via X-A2A-Extensions
+        allow_headers=["authorization", "content-type", HTTP_EXTENSION_HEADER.lower()],
+        expose_headers=[HTTP_EXTENSION_HEADER.lower()],
     )
 
     return app
@@ -1,12 +1,17 @@
 """Data models for Google Cloud Marketplace Procurement integration."""
 
-from datetime import datetime
+from datetime import UTC, datetime
 from enum import Enum
 from typing import Any
 
 from pydantic import BaseModel, Field
 
 
+def _utcnow() -> datetime:
+    """Current time as an aware UTC datetime (stored columns are timestamptz)."""
+    return datetime.now(UTC)
+
+
 class ProcurementEventType(str, Enum):
     """Marketplace Procurement event types from Pub/Sub."""
 
@@ -146,11 +151,11 @@ class Account(BaseModel):
     )
     provider_id: str = Field(..., description="Provider ID")
     created_at: datetime = Field(
-        default_factory=datetime.utcnow,
+        default_factory=_utcnow,
         description="Creation timestamp",
     )
     updated_at: datetime = Field(
-        default_factory=datetime.utcnow,
+        default_factory=_utcnow,
         description="Last update timestamp",
     )
     metadata: dict[str, Any] = Field(
@@ -187,11 +192,11 @@ class Entitlement(BaseModel):
         description="Reason for cancellation",
     )
     created_at: datetime = Field(
-        default_factory=datetime.utcnow,
+        default_factory=_utcnow,
         description="Creation timestamp",
     )
     updated_at: datetime = Field(
-        default_factory=datetime.utcnow,
+        default_factory=_utcnow,
         description="Last update timestamp",
     )
     metadata: dict[str, Any] = Field(
@@ -9,25 +9,46 @@ intelligently routes based on request content.
 """
 
 import base64
-import json
 import logging
 from typing import Any
 
-from fastapi import APIRouter, HTTPException, Request
-from fastapi.responses import JSONResponse
+import orjson
+from fastapi import APIRouter, HTTPException, Request, Response
 
 from lightspeed_agent.config import get_settings
 from lightspeed_agent.dcr import DCRError, DCRRequest, DCRResponse, get_dcr_service
-from lightspeed_agent.marketplace.models import ProcurementEvent, ProcurementEventType
+from lightspeed_agent.marketplace.models import (
+    AccountInfo,
+    EntitlementInfo,
+    ProcurementEvent,
+    ProcurementEventType,
+)
 from lightspeed_agent.marketplace.service import get_procurement_service
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(tags=["Marketplace Handler"])
 
+# Client registration data (and secrets) must not be kept by caches (RFC 7592)
+NO_STORE_HEADERS = {"Cache-Control": "no-store"}
+
+
+def _json_response(
+    content: dict[str, Any],
+    status_code: int = 200,
+    headers: dict[str, str] | None = None,
+) -> Response:
+    """Build a JSON response with the body serialized by orjson."""
+    return Response(
+        content=orjson.dumps(content),
+        status_code=status_code,
+        headers=headers,
+        media_type="application/json",
+    )
+
 
 @router.post("/dcr")
-async def hybrid_dcr_handler(request: Request) -> JSONResponse:
+async def hybrid_dcr_handler(request: Request) -> Response:
     """Hybrid handler for DCR and Pub/Sub events.
 
     This endpoint handles two types of requests:
@@ -67,14 +88,14 @@ async def hybrid_dcr_handler(request: Request) -> JSONResponse:
         )
 
 
-async def _handle_dcr_request(body: dict[str, Any]) -> JSONResponse:
+async def _handle_dcr_request(body: dict[str, Any]) -> Response:
     """Handle a direct DCR request from Gemini Enterprise.
 
     Args:
         body: Request body containing software_statement.
 
     Returns:
-        JSONResponse with client credentials or error.
+        JSON response with client credentials or error.
     """
     logger.info("Processing DCR request")
 
@@ -89,33 +110,35 @@ async def _handle_dcr_request(body: dict[str, Any]) -> JSONResponse:
 
     if isinstance(result, DCRError):
         logger.warning("DCR error: %s - %s", result.error, result.error_description)
-        return JSONResponse(
+        return _json_response(
             status_code=400,
             content={
                 "error": result.error.value,
                 "error_description": result.error_description,
             },
+            headers=NO_STORE_HEADERS,
         )
 
     logger.info("DCR successful: client_id=%s", result.client_id)
-    return JSONResponse(
+    return _json_response(
         status_code=201,
         content={
             "client_id": result.client_id,
             "client_secret": result.client_secret,
             "client_secret_expires_at": result.client_secret_expires_at,
         },
+        headers=NO_STORE_HEADERS,
     )
 
 
-async def _handle_pubsub_event(body: dict[str, Any]) -> JSONResponse:
+async def _handle_pubsub_event(body: dict[str, Any]) -> Response:
     """Handle a Pub/Sub event from Google Cloud Marketplace.
 
     Args:
         body: Request body containing Pub/Sub message.
 
     Returns:
-        JSONResponse acknowledging the event.
+        JSON response acknowledging the event.
     """
     message = body.get("message", {})
     message_id = message.get("messageId", "unknown")
@@ -126,14 +149,13 @@ async def _handle_pubsub_event(body: dict[str, Any]) -> JSONResponse:
     data_b64 = message.get("data", "")
     if not data_b64:
         logger.warning("Empty Pub/Sub message data")
-        return JSONResponse(content={"status": "ok", "message": "Empty message"})
+        return _json_response({"status": "ok", "message": "Empty message"})
 
     try:
-        data_json = base64.b64decode(data_b64).decode("utf-8")
-        data = json.loads(data_json)
+        data = orjson.loads(base64.b64decode(data_b64))
     except Exception as e:
         logger.error("Failed to decode Pub/Sub message: %s", e)
-        return JSONResponse(
+        return _json_response(
             status_code=400,
             content={"error": "Invalid message encoding"},
         )
@@ -147,20 +169,20 @@ async def _handle_pubsub_event(body: dict[str, Any]) -> JSONResponse:
         event_type = ProcurementEventType(event_type_str)
     except ValueError:
         logger.warning("Unknown event type: %s", event_type_str)
-        return JSONResponse(content={"status": "ok", "message": f"Unknown event: {event_type_str}"})
+        return _json_response({"status": "ok", "message": f"Unknown event: {event_type_str}"})
 
     # Build procurement event
     event = _build_procurement_event(data, event_type)
     if not event:
         logger.warning("Could not build procurement event from data")
-        return JSONResponse(content={"status": "ok", "message": "Invalid event data"})
+        return _json_response({"status": "ok", "message": "Invalid event data"})
 
     # Process the event
     procurement_service = get_procurement_service()
     await procurement_service.process_event(event)
 
     logger.info("Processed marketplace event: %s (%s)", message_id, event_type_str)
-    return JSONResponse(content={"status": "ok", "event_type": event_type_str})
+    return _json_response({"status": "ok", "event_type": event_type_str})
 
 
 def _build_procurement_event(
@@ -176,12 +198,6 @@ def _build_procurement_event(
     Returns:
         ProcurementEvent or None if invalid.
     """
-    from lightspeed_agent.marketplace.models import (
-        AccountInfo,
-        EntitlementInfo,
-        ProcurementEvent,
-    )
-
     settings = get_settings()
 
     # Extract common fields
@@ -238,7 +254,7 @@ def _build_procurement_event(
 
 # Also expose the standard DCR endpoints for compatibility
 @router.post("/oauth/register", response_model=DCRResponse)
-async def register_client(request: Request) -> JSONResponse:
+async def register_client(request: Request) -> Response:
     """RFC 7591 compliant DCR endpoint.
 
     Alternative to /dcr for clients that expect the standard path.
@@ -255,7 +271,7 @@ async def register_client(request: Request) -> JSONResponse:
 
 
 @router.get("/oauth/register/{client_id}")
-async def get_client(client_id: str) -> JSONResponse:
+async def get_client(client_id: str) -> Response:
     """Get information about a registered client.
 
     Args:
@@ -270,13 +286,14 @@ async def get_client(client_id: str) -> JSONResponse:
     if not client:
         raise HTTPException(status_code=404, detail="Client not found")
 
-    return JSONResponse(
-        content={
+    return _json_response(
+        {
             "client_id": client.client_id,
             "order_id": client.order_id,
             "account_id": client.account_id,
             "redirect_uris": client.redirect_uris,
             "grant_types": client.grant_types,
             "created_at": client.created_at.isoformat() if client.created_at else None,
-        }
+        },
+        headers=NO_STORE_HEADERS,
     )
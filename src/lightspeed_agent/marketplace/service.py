@@ -32,6 +32,9 @@ class ProcurementService:
     - Managing account and entitlement lifecycle
     - Interacting with the Commerce Procurement API
     - Generating OAuth credentials for orders
+
+    Procurement API calls share one pooled ``httpx.AsyncClient`` so the
+    connection to Google is reused across approvals.
     """
 
     PROCUREMENT_API_BASE = "https://cloudcommerceprocurement.googleapis.com/v1"
@@ -40,16 +43,31 @@ class ProcurementService:
         self,
         account_repo: AccountRepository | None = None,
         entitlement_repo: EntitlementRepository | None = None,
+        http_client: httpx.AsyncClient | None = None,
     ) -> None:
         """Initialize the procurement service.
 
         Args:
             account_repo: Account repository (uses default if not provided).
             entitlement_repo: Entitlement repository (uses default if not provided).
+            http_client: Optional HTTP client for testing.
         """
         self._account_repo = account_repo or get_account_repository()
         self._entitlement_repo = entitlement_repo or get_entitlement_repository()
         self._settings = get_settings()
+        self._http_client = http_client
+
+    def _get_http_client(self) -> httpx.AsyncClient:
+        """Get the pooled HTTP client (lazy initialization)."""
+        if self._http_client is None:
+            self._http_client = httpx.AsyncClient(timeout=30.0)
+        return self._http_client
+
+    async def close(self) -> None:
+        """Close the pooled HTTP client, if one was created."""
+        if self._http_client is not None:
+            await self._http_client.aclose()
+            self._http_client = None
 
     async def process_event(self, event: ProcurementEvent) -> None:
         """Process a procurement event.
@@ -418,24 +436,22 @@ class ProcurementService:
             url = f"{self.PROCUREMENT_API_BASE}/providers/{self._settings.service_control_service_name}/entitlements/{entitlement_id}:approve"
             headers = await self._get_auth_headers()
 
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    url,
-                    json={},
-                    headers=headers,
-                    timeout=30.0,
-                )
+            response = await self._get_http_client().post(
+                url,
+                json={},
+                headers=headers,
+            )
 
-                if response.status_code == 200:
-                    logger.info("Approved entitlement: %s", entitlement_id)
-                    return True
-                else:
-                    logger.error(
-                        "Failed to approve entitlement %s: %s",
-                        entitlement_id,
-                        response.text,
-                    )
-                    return False
+            if response.status_code == 200:
+                logger.info("Approved entitlement: %s", entitlement_id)
+                return True
+            else:
+                logger.error(
+                    "Failed to approve entitlement %s: %s",
+                    entitlement_id,
+                    response.text,
+                )
+                return False
         except Exception as e:
             logger.error("Error approving entitlement %s: %s", entitlement_id, e)
             return False
@@ -460,24 +476,22 @@ class ProcurementService:
             url = f"{self.PROCUREMENT_API_BASE}/providers/{self._settings.service_control_service_name}/accounts/{account_id}:approve"
             headers = await self._get_auth_headers()
 
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    url,
-                    json={},
-                    headers=headers,
-                    timeout=30.0,
-                )
+            response = await self._get_http_client().post(
+                url,
+                json={},
+                headers=headers,
+            )
 
-                if response.status_code == 200:
-                    logger.info("Approved account: %s", account_id)
-                    return True
-                else:
-                    logger.error(
-                        "Failed to approve account %s: %s",
-                        account_id,
-                        response.text,
-                    )
-                    return False
+            if response.status_code == 200:
+                logger.info("Approved account: %s", account_id)
+                return True
+            else:
+                logger.error(
+                    "Failed to approve account %s: %s",
+                    account_id,
+                    response.text,
+                )
+                return False
         except Exception as e:
             logger.error("Error approving account %s: %s", account_id, e)
             return False
@@ -504,28 +518,26 @@ class ProcurementService:
             url = f"{self.PROCUREMENT_API_BASE}/providers/{self._settings.service_control_service_name}/entitlements/{entitlement_id}:approvePlanChange"
             headers = await self._get_auth_headers()
 
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    url,
-                    json={"pendingPlanName": new_plan},
-                    headers=headers,
-                    timeout=30.0,
-                )
+            response = await self._get_http_client().post(
+                url,
+                json={"pendingPlanName": new_plan},
+                headers=headers,
+            )
 
-                if response.status_code == 200:
-                    logger.info(
-                        "Approved plan change for %s: %s",
-                        entitlement_id,
-                        new_plan,
-                    )
-                    return True
-                else:
-                    logger.error(
-                        "Failed to approve plan change for %s: %s",
-                        entitlement_id,
-                        response.text,
-                    )
-                    return False
+            if response.status_code == 200:
+                logger.info(
+                    "Approved plan change for %s: %s",
+                    entitlement_id,
+                    new_plan,
+                )
+                return True
+            else:
+                logger.error(
+                    "Failed to approve plan change for %s: %s",
+                    entitlement_id,
+                    response.text,
+                )
+                return False
         except Exception as e:
             logger.error("Error approving plan change for %s: %s", entitlement_id, e)
             return False
@@ -569,3 +581,9 @@ def get_procurement_service() -> ProcurementService:
     if _procurement_service is None:
         _procurement_service = ProcurementService()
     return _procurement_service
+
+
+async def close_procurement_service() -> None:
+    """Close the global procurement service's HTTP client on shutdown."""
+    if _procurement_service is not None:
+        await _procurement_service.close()
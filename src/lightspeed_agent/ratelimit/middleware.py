@@ -1,6 +1,7 @@
 """Simplified rate limiting middleware with global limits."""
 
 import time
+from collections import deque
 from collections.abc import Callable
 from typing import Any
 
@@ -11,9 +12,14 @@ from starlette.responses import JSONResponse
 from lightspeed_agent.config import get_settings
 
 
-
 class SimpleRateLimiter:
-    """Simple in-memory rate limiter with sliding window."""
+    """Simple in-memory rate limiter with sliding window.
+
+    Each window is a deque of monotonic timestamps, oldest first, capped at
+    its limit: expired entries are popped from the left and a request is
+    only recorded while the window is below its limit, so memory and
+    per-request cost stay bounded regardless of traffic.
+    """
 
     def __init__(
         self,
@@ -22,8 +28,8 @@ class SimpleRateLimiter:
     ):
         self._requests_per_minute = requests_per_minute
         self._requests_per_hour = requests_per_hour
-        self._minute_window: list[float] = []
-        self._hour_window: list[float] = []
+        self._minute_window: deque[float] = deque(maxlen=requests_per_minute)
+        self._hour_window: deque[float] = deque(maxlen=requests_per_hour)
 
     def is_allowed(self) -> tuple[bool, dict]:
         """Check if request is allowed under rate limits.
@@ -31,16 +37,20 @@ class SimpleRateLimiter:
         Returns:
             Tuple of (is_allowed, status_dict with limit info).
         """
-        now = time.time()
+        now = time.monotonic()
         minute_ago = now - 60
         hour_ago = now - 3600
 
-        # Clean old entries
-        self._minute_window = [t for t in self._minute_window if t > minute_ago]
-        self._hour_window = [t for t in self._hour_window if t > hour_ago]
+        # Drop expired entries from the old end of each window
+        minute_window = self._minute_window
+        while minute_window and minute_window[0] <= minute_ago:
+            minute_window.popleft()
+        hour_window = self._hour_window
+        while hour_window and hour_window[0] <= hour_ago:
+            hour_window.popleft()
 
-        minute_count = len(self._minute_window)
-        hour_count = len(self._hour_window)
+        minute_count = len(minute_window)
+        hour_count = len(hour_window)
 
         status = {
             "requests_this_minute": minute_count,
@@ -56,8 +66,8 @@ class SimpleRateLimiter:
             return False, {**status, "exceeded": "per_hour", "retry_after": 3600}
 
         # Record request
-        self._minute_window.append(now)
-        self._hour_window.append(now)
+        minute_window.append(now)
+        hour_window.append(now)
 
         return True, status
 
@@ -111,8 +121,8 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
         """Process request with rate limiting."""
         path = request.url.path
 
-        # Skip rate limiting for non-API paths
-        if self._should_skip(path):
+        # Skip rate limiting for CORS preflights and non-API paths
+        if request.method == "OPTIONS" or self._should_skip(path):
             return await call_next(request)
 
         # Check rate limit
@@ -160,6 +160,58 @@ class TestModels:
         assert caps.extensions[0].uri == "urn:test:dcr"
 
 
+class TestCORS:
+    """Tests for the CORS policy derived from CORS_ALLOWED_ORIGINS."""
+
+    def _preflight(self, allowed_origins: str, origin: str, request_headers: str = ""):
+        """Send a CORS preflight to an app configured with the given origins."""
+        import os
+        from unittest.mock import patch
+
+        from lightspeed_agent.config.settings import get_settings
+
+        with patch.dict(os.environ, {"CORS_ALLOWED_ORIGINS": allowed_origins}):
+            get_settings.cache_clear()
+            try:
+                app = create_app()
+            finally:
+                get_settings.cache_clear()
+        headers = {"Origin": origin, "Access-Control-Request-Method": "POST"}
+        if request_headers:
+            headers["Access-Control-Request-Headers"] = request_headers
+        return TestClient(app).options("/", headers=headers)
+
+    def test_wildcard_origin_disallows_credentials(self):
+        """Test that "*" never allows credentialed cross-origin requests."""
+        response = self._preflight('["*"]', "https://inspector.example.com")
+
+        assert response.headers["access-control-allow-origin"] == "*"
+        assert "access-control-allow-credentials" not in response.headers
+
+    def test_explicit_origins_allow_credentials(self):
+        """Test that explicitly listed origins get credentialed CORS."""
+        response = self._preflight(
+            '["https://inspector.example.com"]', "https://inspector.example.com"
+        )
+
+        assert response.headers["access-control-allow-origin"] == (
+            "https://inspector.example.com"
+        )
+        assert response.headers["access-control-allow-credentials"] == "true"
+
+    def test_a2a_extensions_header_is_allowed(self):
+        """Test that browser clients may send the A2A extensions header."""
+        response = self._preflight(
+            '["https://inspector.example.com"]',
+            "https://inspector.example.com",
+            request_headers="authorization, x-a2a-extensions",
+        )
+
+        assert response.status_code == 200
+        allowed = response.headers["access-control-allow-headers"].lower()
+        assert "x-a2a-extensions" in allowed
+
+
 class TestA2AEndpoints:
     """Tests for A2A API endpoints."""
 
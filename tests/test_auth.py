@@ -6,6 +6,7 @@ from unittest.mock import AsyncMock, MagicMock, patch
 
 import httpx
 import pytest
+from pydantic import ValidationError
 
 from lightspeed_agent.auth import AuthenticatedUser
 from lightspeed_agent.auth.introspection import (
@@ -194,6 +195,53 @@ class TestTokenIntrospector:
             user = await introspector.validate_token("some-token")
             assert user.client_id == "azp-client"
 
+    @pytest.mark.asyncio
+    async def test_successful_introspection_is_cached(self, introspector):
+        """Test that a validated token is not introspected again within the TTL."""
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = {
+            "active": True,
+            "sub": "user-123",
+            "scope": "openid agent:insights",
+            "exp": int(time.time()) + 3600,
+        }
+
+        with patch("httpx.AsyncClient") as mock_client:
+            mock_instance = AsyncMock()
+            mock_instance.post.return_value = mock_response
+            mock_client.return_value = mock_instance
+
+            first = await introspector.validate_token("some-token")
+            second = await introspector.validate_token("some-token")
+
+            assert mock_instance.post.await_count == 1
+            assert second is first
+            assert b"some-token" not in b"".join(introspector._cache)
+
+    @pytest.mark.asyncio
+    async def test_failed_introspection_is_not_cached(self, introspector):
+        """Test that tokens failing the scope check are introspected every time."""
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = {
+            "active": True,
+            "sub": "user-123",
+            "scope": "openid profile",
+            "exp": int(time.time()) + 3600,
+        }
+
+        with patch("httpx.AsyncClient") as mock_client:
+            mock_instance = AsyncMock()
+            mock_instance.post.return_value = mock_response
+            mock_client.return_value = mock_instance
+
+            for _ in range(2):
+                with pytest.raises(InsufficientScopeError):
+                    await introspector.validate_token("no-scope-token")
+
+            assert mock_instance.post.await_count == 2
+
 
 class TestAuthenticatedUser:
     """Tests for AuthenticatedUser model."""
@@ -214,3 +262,54 @@ class TestAuthenticatedUser:
         assert user.user_id == "user-123"
         assert user.client_id == "client-456"
         assert "openid" in user.scopes
+
+    def test_authenticated_user_is_frozen(self):
+        """Test that AuthenticatedUser cannot be mutated after validation."""
+        user = AuthenticatedUser(
+            user_id="user-123",
+            client_id="client-456",
+            token_exp=datetime.now(UTC),
+        )
+
+        with pytest.raises(ValidationError):
+            user.user_id = "someone-else"
+
+
+class TestAuthenticationMiddlewarePaths:
+    """Tests for AuthenticationMiddleware public path matching."""
+
+    @pytest.fixture
+    def middleware(self):
+        """Create middleware wrapping a no-op app."""
+        from lightspeed_agent.auth.middleware import AuthenticationMiddleware
+
+        return AuthenticationMiddleware(app=MagicMock())
+
+    def test_post_root_is_protected(self, middleware):
+        """Test that POST / requires authentication."""
+        assert middleware._is_public("/", "POST") is False
+
+    def test_get_root_is_public(self, middleware):
+        """Test that GET / (agent discovery) is public."""
+        assert middleware._is_public("/", "GET") is True
+
+    def test_public_paths_and_prefixes(self, middleware):
+        """Test explicit public paths and prefixes for any method."""
+        assert middleware._is_public("/health", "GET") is True
+        assert middleware._is_public("/oauth/register", "POST") is True
+        assert middleware._is_public("/marketplace/anything", "POST") is True
+
+    def test_unlisted_path_is_public(self, middleware):
+        """Test that paths outside the protected set default to public."""
+        assert middleware._is_public("/usage", "POST") is True
+
+
+class TestRequireScope:
+    """Tests for the require_scope dependency factory."""
+
+    def test_same_scope_returns_same_dependency(self):
+        """Test that checkers are reused per scope for FastAPI dedup."""
+        from lightspeed_agent.auth.dependencies import require_scope
+
+        assert require_scope("metering:admin") is require_scope("metering:admin")
+        assert require_scope("metering:admin") is not require_scope("agent:insights")
@@ -255,6 +255,59 @@ class TestDCRService:
         assert client.account_id == "valid-account-123"
 
 
+class TestDCRSecretEncryption:
+    """Tests for the Fernet key used to encrypt stored client secrets."""
+
+    def _service(self, encryption_key: str) -> DCRService:
+        """Create a DCR service with DCR_ENCRYPTION_KEY set to the given value."""
+        import os
+        from unittest.mock import MagicMock
+
+        from lightspeed_agent.config.settings import get_settings
+
+        with patch.dict(os.environ, {"DCR_ENCRYPTION_KEY": encryption_key}):
+            get_settings.cache_clear()
+            try:
+                return DCRService(
+                    jwt_validator=MagicMock(),
+                    procurement_service=MagicMock(),
+                    client_repository=MagicMock(),
+                )
+            finally:
+                get_settings.cache_clear()
+
+    def test_configured_key_is_used(self, caplog):
+        """Test that secrets are encrypted with the configured key."""
+        from cryptography.fernet import Fernet
+
+        key = Fernet.generate_key()
+        service = self._service(key.decode())
+
+        encrypted = service._encrypt_secret("test-secret")
+
+        assert Fernet(key).decrypt(encrypted.encode()) == b"test-secret"
+        assert service._decrypt_secret(encrypted) == "test-secret"
+        assert "ephemeral key" not in caplog.text
+
+    @pytest.mark.parametrize("encryption_key", ["", "not-a-fernet-key"])
+    def test_ephemeral_key_fallback(self, caplog, encryption_key):
+        """Test that a missing or invalid key falls back to an ephemeral key."""
+        import logging
+
+        from cryptography.fernet import InvalidToken
+
+        with caplog.at_level(logging.WARNING, logger="lightspeed_agent.dcr.service"):
+            service = self._service(encryption_key)
+            other = self._service(encryption_key)
+
+        assert "DCR_ENCRYPTION_KEY not set or invalid, using ephemeral key" in caplog.text
+        encrypted = service._encrypt_secret("test-secret")
+        assert service._decrypt_secret(encrypted) == "test-secret"
+        # Each service generates its own key, so secrets do not survive a restart
+        with pytest.raises(InvalidToken):
+            other._fernet.decrypt(encrypted.encode())
+
+
 class TestDCRRepository:
     """Tests for DCR client repository with database."""
 
@@ -314,6 +367,7 @@ class TestDCRRouter:
         )
 
         assert response.status_code == 400
+        assert response.headers["cache-control"] == "no-store"
         data = response.json()
         assert data["error"] == "invalid_software_statement"
 
@@ -420,3 +474,222 @@ class TestKeycloakDCRClient:
         assert str(error) == "Failed to create client"
         assert error.status_code == 401
         assert error.details["error"] == "unauthorized"
+
+    @pytest.mark.asyncio
+    async def test_pooled_client_honours_proxy_environment(self, monkeypatch):
+        """Test that the retrying transport does not bypass HTTPS_PROXY."""
+        import httpx
+
+        from lightspeed_agent.dcr.keycloak_client import CONNECT_RETRIES, KeycloakDCRClient
+
+        monkeypatch.setenv("HTTPS_PROXY", "http://proxy.example.com:3128")
+        client = KeycloakDCRClient()
+        http_client = client._get_http_client()
+        try:
+            transport = http_client._transport_for_url(httpx.URL("https://sso.example.com/"))
+            assert transport._pool._proxy_url.host == b"proxy.example.com"
+            # Direct (non-proxied) connections keep the connect retries
+            direct = http_client._transport_for_url(httpx.URL("http://sso.example.com/"))
+            assert direct._pool._retries == CONNECT_RETRIES
+        finally:
+            await client.close()
+
+    @pytest.mark.asyncio
+    async def test_admin_token_is_reused_until_expiry(self):
+        """Test that the Admin API token grant is not repeated per registration."""
+        from unittest.mock import MagicMock
+
+        from lightspeed_agent.dcr.keycloak_client import KeycloakDCRClient
+
+        token_response = MagicMock()
+        token_response.status_code = 200
+        token_response.content = b'{"access_token": "admin-token", "expires_in": 300}'
+        http_client = AsyncMock()
+        http_client.post.return_value = token_response
+
+        client = KeycloakDCRClient(http_client=http_client)
+
+        assert await client._get_admin_token() == "admin-token"
+        assert await client._get_admin_token() == "admin-token"
+        assert http_client.post.await_count == 1
+
+        client._admin_token_expires_at = 0.0
+        await client._get_admin_token()
+        assert http_client.post.await_count == 2
+
+    def _admin_client(self, *responses):
+        """Build a Keycloak client whose Admin API calls return the responses."""
+        from unittest.mock import MagicMock
+
+        from lightspeed_agent.dcr.keycloak_client import KeycloakDCRClient
+
+        def response(status_code: int, content: bytes = b"") -> MagicMock:
+            resp = MagicMock()
+            resp.status_code = status_code
+            resp.content = content
+            resp.text = content.decode()
+            return resp
+
+        http_client = AsyncMock()
+        http_client.post.side_effect = [
+            response(200, b'{"access_token": "token-1", "expires_in": 300}'),
+            response(200, b'{"access_token": "token-2", "expires_in": 300}'),
+        ]
+        http_client.request.side_effect = [response(*r) for r in responses]
+        return KeycloakDCRClient(http_client=http_client), http_client
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "responses",
+        [
+            # Lookup rejected, retried with a fresh token
+            [(401,), (200, b'[{"id": "kc-uuid"}]'), (204,)],
+            # Update rejected, retried with a fresh token
+            [(200, b'[{"id": "kc-uuid"}]'), (401,), (204,)],
+        ],
+    )
+    async def test_admin_api_401_refreshes_token_and_retries(self, responses):
+        """Test that a 401 from the Admin API drops the token and retries once."""
+        client, http_client = self._admin_client(*responses)
+
+        await client._enable_service_accounts("oauth-client")
+
+        assert http_client.post.await_count == 2
+        calls = http_client.request.await_args_list
+        assert len(calls) == 3
+        assert calls[0].kwargs["headers"]["Authorization"] == "Bearer token-1"
+        assert calls[2].kwargs["headers"]["Authorization"] == "Bearer token-2"
+        method, url = calls[2].args
+        assert method == "PUT"
+        assert url.endswith("/clients/kc-uuid")
+        assert client._admin_token == "token-2"
+
+    @pytest.mark.asyncio
+    async def test_admin_api_401_is_retried_only_once(self):
+        """Test that a second 401 gives up instead of looping."""
+        client, http_client = self._admin_client((401,), (401,))
+
+        await client._enable_service_accounts("oauth-client")
+
+        assert http_client.post.await_count == 2
+        assert http_client.request.await_count == 2
+
+
+def _certificate_http_client(keys: dict) -> AsyncMock:
+    """Build an HTTP client mock serving self-signed certificates for the keys."""
+    import datetime
+    from unittest.mock import MagicMock
+
+    import orjson
+    from cryptography import x509
+    from cryptography.hazmat.primitives import hashes, serialization
+    from cryptography.x509.oid import NameOID
+
+    name = x509.Name([x509.NameAttribute(NameOID.COMMON_NAME, "test")])
+    now = datetime.datetime.now(datetime.UTC)
+    certs = {}
+    for kid, key in keys.items():
+        cert = (
+            x509.CertificateBuilder()
+            .subject_name(name)
+            .issuer_name(name)
+            .public_key(key.public_key())
+            .serial_number(1)
+            .not_valid_before(now)
+            .not_valid_after(now + datetime.timedelta(days=1))
+            .sign(key, hashes.SHA256())
+        )
+        certs[kid] = cert.public_bytes(serialization.Encoding.PEM).decode()
+
+    response = MagicMock()
+    response.content = orjson.dumps(certs)
+    response.headers = {}
+    http_client = AsyncMock()
+    http_client.get.return_value = response
+    return http_client
+
+
+class TestGoogleCertificateCache:
+    """Tests for Google certificate cache freshness."""
+
+    def test_parse_max_age(self):
+        """Test extracting max-age from a Cache-Control header."""
+        from lightspeed_agent.dcr.google_jwt import _parse_max_age
+
+        assert _parse_max_age("public, max-age=19845, must-revalidate") == 19845
+        assert _parse_max_age("no-cache") is None
+        assert _parse_max_age("max-age=abc") is None
+        assert _parse_max_age(None) is None
+
+    @pytest.mark.asyncio
+    async def test_non_rsa_certificates_are_skipped(self):
+        """Test that only RSA keys are cached, since only RS256 is accepted."""
+        from cryptography.hazmat.primitives.asymmetric import ec, rsa
+
+        from lightspeed_agent.dcr.google_jwt import GoogleCertificateCache
+
+        rsa_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+        ec_key = ec.generate_private_key(ec.SECP256R1())
+        http_client = _certificate_http_client({"rsa-kid": rsa_key, "ec-kid": ec_key})
+
+        cache = GoogleCertificateCache(http_client=http_client)
+
+        assert await cache.get_public_key("rsa-kid") is not None
+        assert await cache.get_public_key("ec-kid") is None
+        assert list(cache._certificates) == ["rsa-kid"]
+
+    @pytest.mark.asyncio
+    async def test_forced_refreshes_are_throttled(self):
+        """Test that forced refreshes within the interval fetch only once."""
+        from cryptography.hazmat.primitives.asymmetric import rsa
+
+        from lightspeed_agent.dcr.google_jwt import (
+            MIN_FORCED_REFRESH_INTERVAL,
+            GoogleCertificateCache,
+        )
+
+        key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+        http_client = _certificate_http_client({"kid": key})
+        cache = GoogleCertificateCache(http_client=http_client)
+        now = 1000.0
+
+        with patch("lightspeed_agent.dcr.google_jwt.time.monotonic", side_effect=lambda: now):
+            await cache.force_refresh()
+            now += MIN_FORCED_REFRESH_INTERVAL - 1
+            await cache.force_refresh()
+            assert http_client.get.await_count == 1
+
+            now += 1
+            await cache.force_refresh()
+            assert http_client.get.await_count == 2
+
+
+class TestGoogleJWTValidatorCache:
+    """Tests for the validated software_statement cache."""
+
+    def _claims(self, exp: int) -> GoogleJWTClaims:
+        return GoogleJWTClaims(
+            iss="https://www.googleapis.com/service_accounts/v1/metadata/x509/test",
+            iat=exp - 3600,
+            exp=exp,
+            aud="https://agent.example.com",
+            sub="account-123",
+            google={"order": "order-456"},
+        )
+
+    def test_cached_claims_returned_until_expiry(self):
+        """Test that cached claims are served only while the JWT is unexpired."""
+        import time
+
+        from lightspeed_agent.dcr.google_jwt import GoogleJWTValidator
+
+        validator = GoogleJWTValidator(expected_audience="https://agent.example.com")
+        live = self._claims(int(time.time()) + 600)
+        expired = self._claims(int(time.time()) - 1)
+
+        validator._store_claims(b"live", live)
+        validator._store_claims(b"expired", expired)
+
+        assert validator._get_cached_claims(b"live") is live
+        assert validator._get_cached_claims(b"expired") is None
+        assert b"expired" not in validator._claims_cache
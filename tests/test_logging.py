@@ -0,0 +1,114 @@
+"""Tests for application logging setup."""
+
+import logging
+import sys
+from unittest.mock import patch
+
+import orjson
+
+from lightspeed_agent.logging_config import JSONFormatter, create_log_handler
+
+
+def _record(msg: str, *args: object, exc_info=None) -> logging.LogRecord:
+    return logging.LogRecord(
+        name="lightspeed_agent.test",
+        level=logging.ERROR,
+        pathname=__file__,
+        lineno=1,
+        msg=msg,
+        args=args,
+        exc_info=exc_info,
+    )
+
+
+class TestJSONFormatter:
+    """Tests for the orjson log formatter."""
+
+    def test_message_is_escaped(self):
+        """Test that quotes and newlines in the message still yield valid JSON."""
+        line = JSONFormatter().format(_record('client "abc"\nsecond line'))
+
+        assert "\n" not in line
+        entry = orjson.loads(line)
+        assert entry["message"] == 'client "abc"\nsecond line'
+        assert entry["level"] == "ERROR"
+        assert entry["logger"] == "lightspeed_agent.test"
+        assert "time" in entry
+
+    def test_args_are_interpolated(self):
+        """Test that %-style arguments are merged into the message."""
+        line = JSONFormatter().format(_record("order %s: %d clients", "order-1", 2))
+
+        assert orjson.loads(line)["message"] == "order order-1: 2 clients"
+
+    def test_exc_info_is_serialized(self):
+        """Test that tracebacks are kept in their own field."""
+        try:
+            raise ValueError("bad value")
+        except ValueError:
+            record = _record("failed", exc_info=sys.exc_info())
+
+        entry = orjson.loads(JSONFormatter().format(record))
+
+        assert entry["message"] == "failed"
+        assert entry["exc_info"].startswith("Traceback (most recent call last):")
+        assert "ValueError: bad value" in entry["exc_info"]
+
+
+class TestCreateLogHandler:
+    """Tests for the queued stdout log handler."""
+
+    def _emit(self, log_format: str, *records: logging.LogRecord) -> None:
+        """Send records through a fresh handler and stop its listener."""
+        with patch("lightspeed_agent.logging_config.atexit.register") as register:
+            handler = create_log_handler(log_format)
+        stop = register.call_args.args[0]
+        try:
+            for record in records:
+                handler.handle(record)
+        finally:
+            stop()
+
+    def test_listener_is_stopped_at_exit(self):
+        """Test that the listener thread is registered to stop at exit."""
+        with patch("lightspeed_agent.logging_config.atexit.register") as register:
+            create_log_handler("json")
+
+        register.assert_called_once()
+        stop = register.call_args.args[0]
+        listener = stop.__self__
+        assert listener._thread.is_alive()
+
+        stop()
+
+        assert listener._thread is None
+
+    def test_records_reach_stdout(self, capsys):
+        """Test that queued records are written to stdout as JSON lines."""
+        self._emit("json", _record("first"), _record("second %s", "line"))
+
+        lines = capsys.readouterr().out.splitlines()
+        assert [orjson.loads(line)["message"] for line in lines] == ["first", "second line"]
+
+    def test_text_format(self, capsys):
+        """Test that the text format uses the plain formatter."""
+        self._emit("text", _record("plain message"))
+
+        out = capsys.readouterr().out
+        assert " - lightspeed_agent.test - ERROR - plain message" in out
+
+    def test_exc_info_and_stack_info_are_preserved(self, capsys):
+        """Test that tracebacks and stacks survive the queue exactly once."""
+        try:
+            raise ValueError("bad value")
+        except ValueError:
+            record = _record("failed", exc_info=sys.exc_info())
+        record.stack_info = "Stack (most recent call last):\n  frame"
+
+        self._emit("json", record)
+
+        lines = capsys.readouterr().out.splitlines()
+        assert len(lines) == 1
+        entry = orjson.loads(lines[0])
+        assert "ValueError: bad value" in entry["exc_info"]
+        assert entry["stack_info"] == "Stack (most recent call last):\n  frame"